@@ -11,9 +11,25 @@ from urllib.parse import urlparse
 
 # Disable SSL warnings
 import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 warnings.filterwarnings('ignore')
 
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so every WordPress check reuses pooled keep-alive sockets
+# instead of paying a fresh TCP/TLS handshake per probe
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=256, pool_maxsize=256, max_retries=0)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+# Compressed responses cut transfer size; br is offered only when brotli is installed
+SESSION.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': ACCEPT_ENCODING})
+
+# Extracts a URL or bare hostname from plain lists, CSV rows or tool output
+_URL_EXTRACT_RE = re.compile(r'(https?://[^\s,"\'\]\[]+|[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,})')
+
 def validate_url(url):
     """Validate and normalize a URL"""
     if not url:
@@ -29,6 +45,11 @@ def validate_url(url):
     if url.endswith('/'):
         url = url[:-1]
     
+    # Fast path: a dotted host right after the scheme needs no parsing
+    host_start = url.find('//') + 2
+    if url[host_start:host_start + 1] not in ('', '/', '?', '#') and url.find('.', host_start) != -1:
+        return url
+    
     # Validate URL format
     try:
         result = urlparse(url)
@@ -38,32 +59,37 @@ def validate_url(url):
     except:
         return None
 
-def read_urls_from_file(file_path):
-    """Read URLs from a file, ignoring comments and empty lines"""
+def read_urls_from_files(file_paths, seen):
+    """Read URLs from one or more files in a single pass, ignoring comments and empty lines
+    
+    URLs already present in ``seen`` are skipped; new ones are added to it.
+    """
     urls = []
-    try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                    
-                # Extract URL from potential tool output
-                # Common formats: 
-                # - Plain URL: example.com or https://example.com
-                # - CSV: example.com,open,443,https,title
-                # - Tool output: [+] Found: https://example.com
-                
-                # Try to extract URL with regex
-                url_match = re.search(r'(https?://[^\s,"\'\]\[]+|[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,})', line)
-                if url_match:
-                    url = validate_url(url_match.group(1))
-                    if url and url not in urls:
-                        urls.append(url)
+    for file_path in file_paths:
+        try:
+            with open(file_path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    # Skip empty lines and comments
+                    if not line or line[0] == '#':
+                        continue
                         
-    except Exception as e:
-        print(f"Error reading file {file_path}: {str(e)}")
+                    # Extract URL from potential tool output
+                    # Common formats: 
+                    # - Plain URL: example.com or https://example.com
+                    # - CSV: example.com,open,443,https,title
+                    # - Tool output: [+] Found: https://example.com
+                    
+                    # Try to extract URL with regex
+                    url_match = _URL_EXTRACT_RE.search(line)
+                    if url_match:
+                        url = validate_url(url_match.group(1))
+                        if url and url not in seen:
+                            seen.add(url)
+                            urls.append(url)
+                            
+        except Exception as e:
+            print(f"Error reading file {file_path}: {str(e)}")
     
     return urls
 
@@ -75,6 +101,7 @@ def main():
     parser.add_argument('--subdomains', help='File with subdomains enumeration results')
     parser.add_argument('--append', action='store_true', help='Append to output file instead of overwriting')
     parser.add_argument('--check-wordpress', action='store_true', help='Basic check if targets are WordPress (slower)')
+    parser.add_argument('--threads', type=int, default=100, help='Concurrent WordPress checks (default: 100)')
     
     args = parser.parse_args()
     
@@ -82,47 +109,44 @@ def main():
     if not args.input and not args.urls and not args.subdomains:
         parser.error("At least one input method is required: --input, --urls, or --subdomains")
     
+    # List keeps the input order, the set makes membership checks O(1)
     all_urls = []
+    seen = set()
     
     # Process URLs from command line
     if args.urls:
         for url in args.urls:
             normalized_url = validate_url(url)
-            if normalized_url and normalized_url not in all_urls:
+            if normalized_url and normalized_url not in seen:
+                seen.add(normalized_url)
                 all_urls.append(normalized_url)
     
-    # Process URLs from input file
+    # Process URLs from the input file and subdomains file in one pass
+    input_files = []
     if args.input:
         if not os.path.isfile(args.input):
             print(f"Input file not found: {args.input}")
             sys.exit(1)
-            
-        urls_from_file = read_urls_from_file(args.input)
-        for url in urls_from_file:
-            if url not in all_urls:
-                all_urls.append(url)
+        input_files.append(args.input)
     
-    # Process subdomains
     if args.subdomains:
         if not os.path.isfile(args.subdomains):
             print(f"Subdomains file not found: {args.subdomains}")
             sys.exit(1)
-            
-        subdomains = read_urls_from_file(args.subdomains)
-        for url in subdomains:
-            if url not in all_urls:
-                all_urls.append(url)
+        input_files.append(args.subdomains)
+    
+    if input_files:
+        all_urls.extend(read_urls_from_files(input_files, seen))
     
     # Check if targets are WordPress
     if args.check_wordpress and all_urls:
-        import requests
         from concurrent.futures import ThreadPoolExecutor
         
         def check_wordpress(url):
             """Check if a URL is hosting WordPress"""
             try:
                 # Try to access the site with timeout
-                response = requests.get(url, timeout=10, allow_redirects=True, verify=False)
+                response = SESSION.get(url, timeout=10, allow_redirects=True, verify=False)
                 
                 # Check 1: WordPress generator meta tag (most reliable)
                 if '<meta name="generator" content="WordPress' in response.text:
@@ -133,11 +157,12 @@ def main():
                     return url
                 
                 # Check 3: Check common WordPress paths with confidence scoring
+                # Ordered by hit-rate so the common case stops after two probes
                 wp_confidence = 0
                 wp_indicators = [
                     '/wp-login.php',
-                    '/wp-admin/',
                     '/wp-content/',
+                    '/wp-admin/',
                     '/wp-includes/',
                     '/xmlrpc.php',
                     '/wp-json/'
@@ -146,17 +171,16 @@ def main():
                 for indicator in wp_indicators:
                     try:
                         check_url = url + indicator
-                        resp = requests.head(check_url, timeout=5, allow_redirects=False, verify=False)
+                        resp = SESSION.head(check_url, timeout=5, allow_redirects=False, verify=False)
                         # 200, 301, 302, 403 indicate the path exists
                         if resp.status_code in [200, 301, 302, 303, 307, 308, 403]:
                             wp_confidence += 1
+                            # Require at least 2 indicators to reduce false positives
+                            if wp_confidence >= 2:
+                                return url
                     except:
                         pass
-                
-                # Require at least 2 indicators to reduce false positives
-                if wp_confidence >= 2:
-                    return url
-                    
+
                 return None
             except Exception as e:
                 print(f"[ERROR] Error checking {url}: {str(e)}")
@@ -164,20 +188,22 @@ def main():
         
         print(f"Checking {len(all_urls)} targets for WordPress... (this may take a while)")
         
-        # Use ThreadPoolExecutor for parallel checking
+        # Use ThreadPoolExecutor for parallel checking; the checks are pure I/O
+        # so the pool is sized to the shared session's connection pool
         wp_urls = []
-        with ThreadPoolExecutor(max_workers=20) as executor:
+        with ThreadPoolExecutor(max_workers=max(1, min(args.threads, len(all_urls)))) as executor:
             results = list(executor.map(check_wordpress, all_urls))
             wp_urls = [url for url in results if url]
         
         print(f"Found {len(wp_urls)} WordPress sites out of {len(all_urls)} targets")
         all_urls = wp_urls
     
-    # Save URLs to output file
+    # Save URLs to output file with one joined write
     mode = 'a' if args.append else 'w'
-    with open(args.output, mode) as f:
-        for url in all_urls:
-            f.write(f"{url}\n")
+    with open(args.output, mode, buffering=1 << 20) as f:
+        f.write('\n'.join(all_urls))
+        if all_urls:
+            f.write('\n')
     
     print(f"Saved {len(all_urls)} targets to {args.output}")
     print(f"Run mass scan with: python wp_scanner.py -l {args.output} --exploit")
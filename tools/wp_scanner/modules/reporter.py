@@ -2,206 +2,358 @@
 
 import os
 import json
-from datetime import datetime
+import gzip
+import html
+import time
+import threading
+import concurrent.futures
+
+from modules.utils import print_error
+
+# Static page scaffolding, written as whole blocks instead of line by line
+_HTML_PREAMBLE = """<!DOCTYPE html>
+<html lang='en'>
+<head>
+    <meta charset='UTF-8'>
+    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+"""
+
+# Pre-minified stylesheet; the report is read in a browser, not edited by hand
+_HTML_HEAD = """    <style>body{font-family:Arial,sans-serif;margin:20px;background-color:#f4f4f4;color:#333}.container{max-width:900px;margin:auto;background:#fff;padding:20px;border-radius:8px;box-shadow:0 2px 4px rgba(0,0,0,0.1)}h1,h2,h3{color:#0056b3}.section{margin-bottom:20px;padding:15px;border:1px solid #ddd;border-radius:5px;background-color:#fdfdfd}.info-item{margin-bottom:5px}.vulnerability{border:1px solid #ffc107;background-color:#fff3cd;padding:10px;margin-bottom:10px;border-radius:5px}.vulnerability.critical{border-color:#dc3545;background-color:#f8d7da}.vulnerability.high{border-color:#fd7e14;background-color:#fff3cd}.vulnerability.medium{border-color:#ffc107;background-color:#fff3cd}.vulnerability.low{border-color:#17a2b8;background-color:#d1ecf1}.exploit-success{border:1px solid #28a745;background-color:#d4edda;padding:10px;margin-bottom:10px;border-radius:5px}.exploit-failed{border:1px solid #dc3545;background-color:#f8d7da;padding:10px;margin-bottom:10px;border-radius:5px}pre{background-color:#eee;padding:10px;border-radius:5px;overflow-x:auto}.summary-table{width:100%;border-collapse:collapse;margin-top:15px}.summary-table th,.summary-table td{border:1px solid #ddd;padding:8px;text-align:left}.summary-table th{background-color:#e9e9e9}</style>
+</head>
+<body>
+    <div class='container'>
+"""
+
+_HTML_TAIL = """    </div>
+</body>
+</html>
+"""
+
+# Precompiled section templates; each renders with one format_map call
+_HTML_INFO = (
+    "        <div class='section'>\n"
+    "            <h2>WordPress Information</h2>\n"
+    "            <div class='info-item'><strong>Version:</strong> {version}</div>\n"
+    "            <div class='info-item'><strong>Version Sources:</strong> {version_sources}</div>\n"
+    "            <div class='info-item'><strong>Themes:</strong> {themes}</div>\n"
+    "            <div class='info-item'><strong>Plugins:</strong> {plugins}</div>\n"
+    "            <div class='info-item'><strong>Users:</strong> {users} found</div>\n"
+    "            <div class='info-item'><strong>XML-RPC Enabled:</strong> {xmlrpc}</div>\n"
+    "            <div class='info-item'><strong>REST API Enabled:</strong> {rest_api}</div>\n"
+    "        </div>\n"
+)
+
+_HTML_VULN = (
+    "            <div class='vulnerability {severity_cls}'>\n"
+    "                <h4>{title}</h4>\n"
+    "{version}"
+    "                <p><strong>Severity:</strong> {severity}</p>\n"
+    "                <p><strong>Description:</strong> {description}</p>\n"
+    "                <p><strong>CVE:</strong> {cve}</p>\n"
+    "                <p><strong>Affected Version:</strong> {affected_version}</p>\n"
+    "                <p><strong>Fixed In:</strong> {fixed_in}</p>\n"
+    "                <p><strong>Exploitability:</strong> {exploitability}</p>\n"
+    "                <p><strong>Exploit Available:</strong> {exploit}</p>\n"
+    "            </div>\n"
+)
+_HTML_VULN_VERSION = "                <p><strong>Version:</strong> {}</p>\n"
+
+_MD_VULN_DETAILS = (
+    "  - **Title:** {title}\n"
+    "  - **Severity:** {severity}\n"
+    "  - **Description:** {description}\n"
+    "  - **CVE:** {cve}\n"
+    "  - **Affected Version:** {affected_version}\n"
+    "  - **Fixed In:** {fixed_in}\n"
+    "  - **Exploitability:** {exploitability}\n"
+    "  - **Exploit Available:** {exploit}\n"
+    "\n"
+)
+# Core entries lead with the title; plugin and theme entries lead with the component
+_MD_VULN = "- " + _MD_VULN_DETAILS[len("  - "):]
+_MD_COMPONENT_VULN = "- **{}:** {} (v{})\n"
+# "name (vX.Y)" entry in the theme and plugin listings
+_COMPONENT_ITEM = "{} (v{})".format
+
+# Finished reports are flushed to disk off the scanning thread; the pool's
+# worker is joined at interpreter exit, so queued writes always complete
+_REPORT_WRITER = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='report-writer')
+
+def _write_file(report_path, content, compress=False):
+    """Write a fully rendered report to disk, encoding it once and bypassing the text I/O layers."""
+    data = content.encode('utf-8')
+    if compress:
+        # Fastest level: the markup is repetitive enough that level 1 already shrinks it several times
+        data = gzip.compress(data, compresslevel=1)
+    data = memoryview(data)
+    fd = os.open(report_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+# (vulnerabilities key, section heading, component label in Markdown rows)
+_VULN_SECTIONS = (
+    ("core", "WordPress Core Vulnerabilities", None),
+    ("plugins", "Plugin Vulnerabilities", "Plugin"),
+    ("themes", "Theme Vulnerabilities", "Theme")
+)
+
+def _section_groups(vulnerabilities, key):
+    """Yield (component name, component version, vulns) groups for one vulnerability section."""
+    if key == "core":
+        if vulnerabilities.get("core"):
+            yield None, None, vulnerabilities["core"]
+        return
+    for name, data in (vulnerabilities.get(key) or {}).items():
+        if data.get("vulns"):
+            yield name, data.get('version', 'Unknown'), data["vulns"]
+
+def _esc(value):
+    """HTML-escape a report field, coercing non-string values first."""
+    return html.escape(str(value))
+
+# Display defaults for vulnerability fields missing from a record
+_VULN_FIELD_DEFAULTS = {
+    "title": "Unknown",
+    "severity": "Unknown",
+    "description": "N/A",
+    "cve": "N/A",
+    "affected_version": "N/A",
+    "fixed_in": "N/A",
+    "exploitability": "N/A"
+}
+_VULN_FIELDS = tuple(_VULN_FIELD_DEFAULTS) + ("severity_cls", "exploit")
+
+# CSS class per severity label; anything unlisted renders with the neutral style
+_SEVERITY_CLASSES = {s: s.lower() for s in ('Critical', 'High', 'Medium', 'Low', 'Unknown', 'critical', 'high', 'medium', 'low', 'unknown')}
+
+def _vuln_fields(vuln):
+    """Collect a vulnerability's report fields with their display defaults, once for every format."""
+    # A single dict merge applies every default in C instead of one .get() call per field
+    fields = {**_VULN_FIELD_DEFAULTS, **vuln}
+    fields["severity_cls"] = _SEVERITY_CLASSES.get(vuln.get('severity'), 'unknown')
+    fields["exploit"] = 'Yes' if vuln.get('exploit_available') else 'No'
+    return fields
+
+def _render_html_vuln(fields, component=None, component_version=None):
+    """Render one vulnerability as an HTML block, prefixed with the plugin or theme name if given."""
+    row = {key: _esc(fields[key]) for key in _VULN_FIELDS}
+    if component is None:
+        row["version"] = ""
+    else:
+        row["title"] = _esc(component) + ": " + row["title"]
+        row["version"] = _HTML_VULN_VERSION.format(_esc(component_version))
+    return _HTML_VULN.format_map(row)
+
+def _render_md_vuln(fields, label=None, component=None, component_version=None):
+    """Render one vulnerability as a Markdown entry, headed by the plugin or theme if given."""
+    if label is None:
+        return _MD_VULN.format_map(fields)
+    return _MD_COMPONENT_VULN.format(label, component, component_version) + _MD_VULN_DETAILS.format_map(fields)
+
+REPORT_FORMATS = ("html", "md")
+
+def render_reports(target, scan_date, wp_info, vulnerabilities, exploitation_results, formats=REPORT_FORMATS):
+    """
+    Render reports in several formats from a single pass over the scan results.
+    Pure function with no shared state, so it is safe to call from several threads at once.
+    Returns a dictionary mapping each format to the rendered report text.
+    """
+    unknown = set(formats) - set(REPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unsupported report format(s): {', '.join(sorted(unknown))}")
+    html_parts = [] if "html" in formats else None
+    md_parts = [] if "md" in formats else None
+
+    # Component listings are shared by every format
+    themes = ", ".join(_COMPONENT_ITEM(t.get('name', 'Unknown'), t.get('version', 'Unknown')) for t in wp_info.get("themes", ()))
+    plugins = ", ".join(_COMPONENT_ITEM(p.get('name', 'Unknown'), p.get('version', 'Unknown')) for p in wp_info.get("plugins", {}).values())
+    if html_parts is not None:
+        _html_intro(html_parts, target, scan_date, wp_info, themes, plugins)
+    if md_parts is not None:
+        _md_intro(md_parts, target, scan_date, wp_info, themes, plugins)
+
+    # Vulnerabilities: each record's fields are gathered once and fed to every format;
+    # sections without findings are left out entirely
+    vulnerabilities = vulnerabilities or {}
+    found_any = False
+    for key, heading, label in _VULN_SECTIONS:
+        groups = list(_section_groups(vulnerabilities, key))
+        if not groups:
+            continue
+        found_any = True
+        if html_parts is not None:
+            html_parts.append(f"            <h3>{heading}</h3>\n")
+        if md_parts is not None:
+            md_parts.append(f"### {heading}\n")
+        for component, component_version, vulns in groups:
+            for vuln in vulns:
+                fields = _vuln_fields(vuln)
+                if html_parts is not None:
+                    html_parts.append(_render_html_vuln(fields, component, component_version))
+                if md_parts is not None:
+                    md_parts.append(_render_md_vuln(fields, label, component, component_version))
+
+    if not found_any:
+        if html_parts is not None:
+            html_parts.append("            <p>None</p>\n")
+        if md_parts is not None:
+            md_parts.append("None\n")
+
+    # Exploitation Results
+    if html_parts is not None:
+        html_parts.append("        </div>\n")
+        html_parts.append("        <div class='section'>\n")
+        html_parts.append("            <h2>Exploitation Results</h2>\n")
+    if md_parts is not None:
+        md_parts.append("\n")
+        md_parts.append("## Exploitation Results\n")
+    if not exploitation_results:
+        if html_parts is not None:
+            html_parts.append("            <p>None</p>\n")
+        if md_parts is not None:
+            md_parts.append("None\n")
+    for result in exploitation_results or ():
+        # Exploit data is serialised once and shared by every format
+        data = json.dumps(result['data'], indent=2) if result.get('data') else None
+        if html_parts is not None:
+            _html_exploit(html_parts, result, data)
+        if md_parts is not None:
+            _md_exploit(md_parts, result, data)
+
+    reports = {}
+    if html_parts is not None:
+        html_parts.append("        </div>\n")
+        html_parts.append(_HTML_TAIL)
+        reports["html"] = "".join(html_parts)
+    if md_parts is not None:
+        md_parts.append("\n")
+        reports["md"] = "".join(md_parts)
+    return reports
+
+def _html_intro(parts, target, scan_date, wp_info, themes, plugins):
+    """Append the HTML head, report header and WordPress information section."""
+    # Every dynamic field is escaped; scan data comes from the target and may carry markup
+    target = _esc(target)
+    parts.append(_HTML_PREAMBLE)
+    parts.append("    <title>WP-Scanner Report - " + target + "</title>\n")
+    parts.append(_HTML_HEAD)
+    parts.append(
+        "        <h1>WP-Scanner Report</h1>\n"
+        "        <p><strong>Target:</strong> " + target + "</p>\n"
+        "        <p><strong>Scan Date:</strong> " + scan_date + "</p>\n"
+    )
+
+    # WordPress Information
+    parts.append(_HTML_INFO.format_map({
+        "version": _esc(wp_info.get("version", "Unknown")),
+        "version_sources": _esc(", ".join(wp_info.get("version_sources", []))),
+        "themes": _esc(themes),
+        "plugins": _esc(plugins),
+        "users": len(wp_info.get("users", [])),
+        "xmlrpc": "Yes" if wp_info.get("xmlrpc_enabled") else "No",
+        "rest_api": "Yes" if wp_info.get("rest_api_enabled") else "No"
+    }))
+
+    parts.append("        <div class='section'>\n")
+    parts.append("            <h2>Vulnerabilities Found</h2>\n")
+
+def _md_intro(parts, target, scan_date, wp_info, themes, plugins):
+    """Append the Markdown report header and WordPress information section."""
+    parts.append(f"# WP-Scanner Report - {target}\n")
+    parts.append(f"**Scan Date:** {scan_date}\n\n")
+
+    # WordPress Information
+    parts.append("## WordPress Information\n")
+    parts.append(f"- **Version:** {wp_info.get('version', 'Unknown')}\n")
+    parts.append(f"- **Version Sources:** {', '.join(wp_info.get('version_sources', []))}\n")
+    parts.append("- **Themes:** " + themes + "\n")
+    parts.append("- **Plugins:** " + plugins + "\n")
+    parts.append(f"- **Users Found:** {len(wp_info.get('users', []))}\n")
+    parts.append(f"- **XML-RPC Enabled:** {'Yes' if wp_info.get('xmlrpc_enabled') else 'No'}\n")
+    parts.append(f"- **REST API Enabled:** {'Yes' if wp_info.get('rest_api_enabled') else 'No'}\n")
+    parts.append("\n")
+
+    parts.append("## Vulnerabilities Found\n")
+
+def _html_exploit(parts, result, data):
+    """Append one exploitation result to an HTML report."""
+    status_class = "exploit-success" if result.get("status") == "success" else "exploit-failed"
+    parts.append(f"            <div class='{status_class}'>\n")
+    parts.append(f"                <h4>{_esc(result.get('vulnerability', 'Unknown Exploit'))} - Status: {_esc(result.get('status'))}</h4>\n")
+    parts.append(f"                <p><strong>Details:</strong> {_esc(result.get('details', 'N/A'))}</p>\n")
+    if result.get('reason'):
+        parts.append(f"                <p><strong>Reason:</strong> {_esc(result.get('reason'))}</p>\n")
+    if data is not None:
+        parts.append("                <p><strong>Data:</strong></p>\n")
+        parts.append("                <pre>" + _esc(data) + "</pre>\n")
+    parts.append("            </div>\n")
+
+def _md_exploit(parts, result, data):
+    """Append one exploitation result to a Markdown report."""
+    parts.append(f"### {result.get('vulnerability', 'Unknown Exploit')} - Status: {result.get('status')}\n")
+    parts.append(f"- **Details:** {result.get('details', 'N/A')}\n")
+    if result.get('reason'):
+        parts.append(f"- **Reason:** {result.get('reason')}\n")
+    if data is not None:
+        parts.append("- **Data:**\n")
+        parts.append("```json\n" + data + "\n```\n")
+    parts.append("\n")
 
 class Reporter:
-    def __init__(self, output_dir, target):
+    FORMATS = REPORT_FORMATS
+
+    def __init__(self, output_dir, target, compress=False):
         self.output_dir = output_dir
         self.target = target
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.compress = compress
+        # One clock read per scan keeps the HTML and Markdown dates identical
+        now = time.localtime()
+        self.timestamp = time.strftime("%Y%m%d_%H%M%S", now)
+        self.scan_date_str = time.strftime("%Y-%m-%d %H:%M:%S", now)
+        self._pending_writes = []
+        self._pending_lock = threading.Lock()
+
+    def _submit_write(self, report_path, content):
+        """Queue a rendered report for writing so the caller can move on to the next target."""
+        def report_failure(future):
+            if future.exception():
+                print_error(f"Error writing report {report_path}: {future.exception()}")
+
+        future = _REPORT_WRITER.submit(_write_file, report_path, content, self.compress)
+        future.add_done_callback(report_failure)
+        with self._pending_lock:
+            self._pending_writes.append(future)
+
+    def wait_for_writes(self):
+        """Block until every report queued by this Reporter is on disk."""
+        with self._pending_lock:
+            pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.exception()
 
     def generate_html_report(self, wp_info, vulnerabilities, exploitation_results):
         """Generates an HTML report of the scan results."""
-        report_path = os.path.join(self.output_dir, f"report_{self.timestamp}.html")
-        with open(report_path, 'w') as f:
-            f.write("<!DOCTYPE html>\n")
-            f.write("<html lang='en'>\n")
-            f.write("<head>\n")
-            f.write("    <meta charset='UTF-8'>\n")
-            f.write("    <meta name='viewport' content='width=device-width, initial-scale=1.0'>\n")
-            f.write("    <title>WP-Scanner Report - " + self.target + "</title>\n")
-            f.write("    <style>\n")
-            f.write("        body { font-family: Arial, sans-serif; margin: 20px; background-color: #f4f4f4; color: #333; }\n")
-            f.write("        .container { max-width: 900px; margin: auto; background: #fff; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }\n")
-            f.write("        h1, h2, h3 { color: #0056b3; }\n")
-            f.write("        .section { margin-bottom: 20px; padding: 15px; border: 1px solid #ddd; border-radius: 5px; background-color: #fdfdfd; }\n")
-            f.write("        .info-item { margin-bottom: 5px; }\n")
-            f.write("        .vulnerability { border: 1px solid #ffc107; background-color: #fff3cd; padding: 10px; margin-bottom: 10px; border-radius: 5px; }\n")
-            f.write("        .vulnerability.critical { border-color: #dc3545; background-color: #f8d7da; }\n")
-            f.write("        .vulnerability.high { border-color: #fd7e14; background-color: #fff3cd; }\n")
-            f.write("        .vulnerability.medium { border-color: #ffc107; background-color: #fff3cd; }\n")
-            f.write("        .vulnerability.low { border-color: #17a2b8; background-color: #d1ecf1; }\n")
-            f.write("        .exploit-success { border: 1px solid #28a745; background-color: #d4edda; padding: 10px; margin-bottom: 10px; border-radius: 5px; }\n")
-            f.write("        .exploit-failed { border: 1px solid #dc3545; background-color: #f8d7da; padding: 10px; margin-bottom: 10px; border-radius: 5px; }\n")
-            f.write("        pre { background-color: #eee; padding: 10px; border-radius: 5px; overflow-x: auto; }\n")
-            f.write("        .summary-table { width: 100%; border-collapse: collapse; margin-top: 15px; }\n")
-            f.write("        .summary-table th, .summary-table td { border: 1px solid #ddd; padding: 8px; text-align: left; }\n")
-            f.write("        .summary-table th { background-color: #e9e9e9; }\n")
-            f.write("    </style>\n")
-            f.write("</head>\n")
-            f.write("<body>\n")
-            f.write("    <div class='container'>\n")
-            f.write("        <h1>WP-Scanner Report</h1>\n")
-            f.write("        <p><strong>Target:</strong> " + self.target + "</p>\n")
-            f.write("        <p><strong>Scan Date:</strong> " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "</p>\n")
-
-            # WordPress Information
-            f.write("        <div class='section'>\n")
-            f.write("            <h2>WordPress Information</h2>\n")
-            f.write("            <div class='info-item'><strong>Version:</strong> " + wp_info.get("version", "Unknown") + "</div>\n")
-            f.write("            <div class='info-item'><strong>Version Sources:</strong> " + ", ".join(wp_info.get("version_sources", [])) + "</div>\n")
-            f.write("            <div class='info-item'><strong>Themes:</strong> " + ", ".join([f"{t.get('name', 'Unknown')} (v{t.get('version', 'Unknown')})" for t in wp_info.get("themes", [])]) + "</div>\n")
-            f.write("            <div class='info-item'><strong>Plugins:</strong> " + ", ".join([f"{p.get('name', 'Unknown')} (v{p.get('version', 'Unknown')})" for p in wp_info.get("plugins", {{}}).values()]) + "</div>\n")
-            f.write("            <div class='info-item'><strong>Users:</strong> " + str(len(wp_info.get("users", []))) + " found</div>\n")
-            f.write("            <div class='info-item'><strong>XML-RPC Enabled:</strong> " + ("Yes" if wp_info.get("xmlrpc_enabled") else "No") + "</div>\n")
-            f.write("            <div class='info-item'><strong>REST API Enabled:</strong> " + ("Yes" if wp_info.get("rest_api_enabled") else "No") + "</div>\n")
-            f.write("        </div>\n")
-
-            # Vulnerabilities
-            f.write("        <div class='section'>\n")
-            f.write("            <h2>Vulnerabilities Found</h2>\n")
-            # Core Vulnerabilities
-            f.write("            <h3>WordPress Core Vulnerabilities</h3>\n")
-            for vuln in vulnerabilities["core"]:
-                f.write(f"            <div class='vulnerability {vuln.get('severity', 'unknown').lower()}'>\n")
-                f.write(f"                <h4>{vuln.get('title', 'Unknown')}</h4>\n")
-                f.write(f"                <p><strong>Severity:</strong> {vuln.get('severity', 'Unknown')}</p>\n")
-                f.write(f"                <p><strong>Description:</strong> {vuln.get('description', 'N/A')}</p>\n")
-                f.write(f"                <p><strong>CVE:</strong> {vuln.get('cve', 'N/A')}</p>\n")
-                f.write(f"                <p><strong>Affected Version:</strong> {vuln.get('affected_version', 'N/A')}</p>\n")
-                f.write(f"                <p><strong>Fixed In:</strong> {vuln.get('fixed_in', 'N/A')}</p>\n")
-                f.write(f"                <p><strong>Exploitability:</strong> {vuln.get('exploitability', 'N/A')}</p>\n")
-                f.write(f"                <p><strong>Exploit Available:</strong> {'Yes' if vuln.get('exploit_available') else 'No'}</p>\n")
-                f.write("            </div>\n")
-            
-            # Plugin Vulnerabilities
-            f.write("            <h3>Plugin Vulnerabilities</h3>\n")
-            for plugin_name, plugin_data in vulnerabilities["plugins"].items():
-                for vuln in plugin_data.get("vulns", []):
-                    f.write(f"            <div class='vulnerability {vuln.get('severity', 'unknown').lower()}'>\n")
-                    f.write(f"                <h4>{plugin_name}: {vuln.get('title', 'Unknown')}</h4>\n")
-                    f.write(f"                <p><strong>Version:</strong> {plugin_data.get('version', 'Unknown')}</p>\n")
-                    f.write(f"                <p><strong>Severity:</strong> {vuln.get('severity', 'Unknown')}</p>\n")
-                    f.write(f"                <p><strong>Description:</strong> {vuln.get('description', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>CVE:</strong> {vuln.get('cve', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Affected Version:</strong> {vuln.get('affected_version', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Fixed In:</strong> {vuln.get('fixed_in', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Exploitability:</strong> {vuln.get('exploitability', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Exploit Available:</strong> {'Yes' if vuln.get('exploit_available') else 'No'}</p>\n")
-                    f.write("            </div>\n")
-
-            # Theme Vulnerabilities
-            f.write("            <h3>Theme Vulnerabilities</h3>\n")
-            for theme_name, theme_data in vulnerabilities["themes"].items():
-                for vuln in theme_data.get("vulns", []):
-                    f.write(f"            <div class='vulnerability {vuln.get('severity', 'unknown').lower()}'>\n")
-                    f.write(f"                <h4>{theme_name}: {vuln.get('title', 'Unknown')}</h4>\n")
-                    f.write(f"                <p><strong>Version:</strong> {theme_data.get('version', 'Unknown')}</p>\n")
-                    f.write(f"                <p><strong>Severity:</strong> {vuln.get('severity', 'Unknown')}</p>\n")
-                    f.write(f"                <p><strong>Description:</strong> {vuln.get('description', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>CVE:</strong> {vuln.get('cve', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Affected Version:</strong> {vuln.get('affected_version', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Fixed In:</strong> {vuln.get('fixed_in', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Exploitability:</strong> {vuln.get('exploitability', 'N/A')}</p>\n")
-                    f.write(f"                <p><strong>Exploit Available:</strong> {'Yes' if vuln.get('exploit_available') else 'No'}</p>\n")
-                    f.write("            </div>\n")
-            f.write("        </div>\n")
-
-            # Exploitation Results
-            f.write("        <div class='section'>\n")
-            f.write("            <h2>Exploitation Results</h2>\n")
-            for result in exploitation_results:
-                status_class = "exploit-success" if result.get("status") == "success" else "exploit-failed"
-                f.write(f"            <div class='{status_class}'>\n")
-                f.write(f"                <h4>{result.get('vulnerability', 'Unknown Exploit')} - Status: {result.get('status')}</h4>\n")
-                f.write(f"                <p><strong>Details:</strong> {result.get('details', 'N/A')}</p>\n")
-                if result.get('reason'):
-                    f.write(f"                <p><strong>Reason:</strong> {result.get('reason')}</p>\n")
-                if result.get('data'):
-                    f.write("                <p><strong>Data:</strong></p>\n")
-                    f.write("                <pre>" + json.dumps(result['data'], indent=2) + "</pre>\n")
-                f.write("            </div>\n")
-            f.write("        </div>\n")
-
-            f.write("    </div>\n")
-            f.write("</body>\n")
-            f.write("</html>\n")
-        return report_path
+        return self.generate_reports(wp_info, vulnerabilities, exploitation_results, formats=("html",))["html"]
 
     def generate_markdown_report(self, wp_info, vulnerabilities, exploitation_results):
         """Generates a Markdown report of the scan results."""
-        report_path = os.path.join(self.output_dir, f"report_{self.timestamp}.md")
-        with open(report_path, 'w') as f:
-            f.write(f"# WP-Scanner Report - {self.target}\n")
-            f.write(f"**Scan Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            # WordPress Information
-            f.write("## WordPress Information\n")
-            f.write(f"- **Version:** {wp_info.get('version', 'Unknown')}\n")
-            f.write(f"- **Version Sources:** {', '.join(wp_info.get('version_sources', []))}\n")
-            f.write(f"- **Themes:** {', '.join([f'{t.get('name', 'Unknown')} (v{t.get('version', 'Unknown')})' for t in wp_info.get('themes', [])])}\n")
-            f.write(f"- **Plugins:** {', '.join([f'{p.get('name', 'Unknown')} (v{p.get('version', 'Unknown')})' for p in wp_info.get('plugins', {}).values()])}\n")
-            f.write(f"- **Users Found:** {len(wp_info.get('users', []))}\n")
-            f.write(f"- **XML-RPC Enabled:** {'Yes' if wp_info.get('xmlrpc_enabled') else 'No'}\n")
-            f.write(f"- **REST API Enabled:** {'Yes' if wp_info.get('rest_api_enabled') else 'No'}\n")
-            f.write("\n")
-
-            # Vulnerabilities
-            f.write("## Vulnerabilities Found\n")
-            # Core Vulnerabilities
-            f.write("### WordPress Core Vulnerabilities\n")
-            for vuln in vulnerabilities["core"]:
-                f.write(f"- **Title:** {vuln.get('title', 'Unknown')}\n")
-                f.write(f"  - **Severity:** {vuln.get('severity', 'Unknown')}\n")
-                f.write(f"  - **Description:** {vuln.get('description', 'N/A')}\n")
-                f.write(f"  - **CVE:** {vuln.get('cve', 'N/A')}\n")
-                f.write(f"  - **Affected Version:** {vuln.get('affected_version', 'N/A')}\n")
-                f.write(f"  - **Fixed In:** {vuln.get('fixed_in', 'N/A')}\n")
-                f.write(f"  - **Exploitability:** {vuln.get('exploitability', 'N/A')}\n")
-                f.write(f"  - **Exploit Available:** {'Yes' if vuln.get('exploit_available') else 'No'}\n")
-                f.write("\n")
-            
-            # Plugin Vulnerabilities
-            f.write("### Plugin Vulnerabilities\n")
-            for plugin_name, plugin_data in vulnerabilities["plugins"].items():
-                for vuln in plugin_data.get("vulns", []):
-                    f.write(f"- **Plugin:** {plugin_name} (v{plugin_data.get('version', 'Unknown')})\n")
-                    f.write(f"  - **Title:** {vuln.get('title', 'Unknown')}\n")
-                    f.write(f"  - **Severity:** {vuln.get('severity', 'Unknown')}\n")
-                    f.write(f"  - **Description:** {vuln.get('description', 'N/A')}\n")
-                    f.write(f"  - **CVE:** {vuln.get('cve', 'N/A')}\n")
-                    f.write(f"  - **Affected Version:** {vuln.get('affected_version', 'N/A')}\n")
-                    f.write(f"  - **Fixed In:** {vuln.get('fixed_in', 'N/A')}\n")
-                    f.write(f"  - **Exploitability:** {vuln.get('exploitability', 'N/A')}\n")
-                    f.write(f"  - **Exploit Available:** {'Yes' if vuln.get('exploit_available') else 'No'}\n")
-                    f.write("\n")
-
-            # Theme Vulnerabilities
-            f.write("### Theme Vulnerabilities\n")
-            for theme_name, theme_data in vulnerabilities["themes"].items():
-                for vuln in theme_data.get("vulns", []):
-                    f.write(f"- **Theme:** {theme_name} (v{theme_data.get('version', 'Unknown')})\n")
-                    f.write(f"  - **Title:** {vuln.get('title', 'Unknown')}\n")
-                    f.write(f"  - **Severity:** {vuln.get('severity', 'Unknown')}\n")
-                    f.write(f"  - **Description:** {vuln.get('description', 'N/A')}\n")
-                    f.write(f"  - **CVE:** {vuln.get('cve', 'N/A')}\n")
-                    f.write(f"  - **Affected Version:** {vuln.get('affected_version', 'N/A')}\n")
-                    f.write(f"  - **Fixed In:** {vuln.get('fixed_in', 'N/A')}\n")
-                    f.write(f"  - **Exploitability:** {vuln.get('exploitability', 'N/A')}\n")
-                    f.write(f"  - **Exploit Available:** {'Yes' if vuln.get('exploit_available') else 'No'}\n")
-                    f.write("\n")
-            f.write("\n")
-
-            # Exploitation Results
-            f.write("## Exploitation Results\n")
-            for result in exploitation_results:
-                f.write(f"### {result.get('vulnerability', 'Unknown Exploit')} - Status: {result.get('status')}\n")
-                f.write(f"- **Details:** {result.get('details', 'N/A')}\n")
-                if result.get('reason'):
-                    f.write(f"- **Reason:** {result.get('reason')}\n")
-                if result.get('data'):
-                    f.write("- **Data:**\n")
-                    f.write("```json\n" + json.dumps(result['data'], indent=2) + "\n```\n")
-                f.write("\n")
-            f.write("\n")
-        return report_path
+        return self.generate_reports(wp_info, vulnerabilities, exploitation_results, formats=("md",))["md"]
+
+    def generate_reports(self, wp_info, vulnerabilities, exploitation_results, formats=REPORT_FORMATS):
+        """
+        Generate reports in several formats from a single pass over the scan results.
+        Returns a dictionary mapping each format to its report path.
+        """
+        reports = render_reports(self.target, self.scan_date_str, wp_info, vulnerabilities, exploitation_results, formats)
+        report_paths = {}
+        for extension, content in reports.items():
+            report_path = os.path.join(self.output_dir, f"report_{self.timestamp}.{extension}")
+            if self.compress:
+                report_path += ".gz"
+            self._submit_write(report_path, content)
+            report_paths[extension] = report_path
+        return report_paths
@@ -2,27 +2,79 @@
 # WP-Scanner - Updater module
 # This module handles updates for both the tool and vulnerability databases
 
+import io
 import os
+import hashlib
 import sys
+import re
+import stat
 import json
-import subprocess
 import time
-import requests
-import shutil
-import tempfile
-import zipfile
 from datetime import datetime
 from packaging import version
 from colorama import Fore, Style
 
+# Escape codes only when talking to a terminal; piped and CI output gets plain text
+_TTY = sys.stdout.isatty()
+_RED = Fore.RED if _TTY else ""
+_GREEN = Fore.GREEN if _TTY else ""
+_YELLOW = Fore.YELLOW if _TTY else ""
+_BLUE = Fore.BLUE if _TTY else ""
+_RESET = Style.RESET_ALL if _TTY else ""
+
+_TOOL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_VERSION_FILE = os.path.join(_TOOL_DIR, "version.json")
+# Seed vulnerability databases shipped with the tool, copied when a database is missing
+_SEED_DIR = os.path.join(_TOOL_DIR, "data")
+
+# Release entries kept from the current install when it already has them
+_PRESERVED_NAMES = frozenset({"data", "version.json"})
+# Release entries never installed: VCS metadata, caches and virtualenvs
+_SKIP_NAMES = frozenset({".git", "__pycache__", ".venv"})
+_SKIP_PATTERNS = re.compile(r".*\.(pyc|pyo)$")
+
+def _extract_parallel(zip_ref, dest):
+    """Extract every member of zip_ref into dest, inflating members on threads
+    
+    zlib releases the GIL while decompressing, so threads overlap the CPU work
+    without the pickling and start-up cost of a process pool.
+    """
+    import concurrent.futures
+    
+    files = [member for member in zip_ref.infolist() if not member.is_dir()]
+    workers = min(os.cpu_count() or 1, 8, len(files))
+    if workers <= 1:
+        zip_ref.extractall(dest)
+        return
+    
+    # Create all parent directories first so the workers never race on makedirs;
+    # empty, "." and ".." components are dropped the same way ZipFile.extract does
+    for parent in {member.filename.rsplit("/", 1)[0] for member in files if "/" in member.filename}:
+        parts = [part for part in parent.split("/") if part not in ("", ".", "..")]
+        if parts:
+            os.makedirs(os.path.join(dest, *parts), exist_ok=True)
+    for member in zip_ref.infolist():
+        if member.is_dir():
+            zip_ref.extract(member, dest)
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda member: zip_ref.extract(member, dest), files))
+
 class Updater:
     """Handles updates for the WP-Scanner tool and vulnerability databases"""
     
+    # How long a successful check_for_updates answer is reused (seconds)
+    _check_cache_ttl = 6 * 3600
+    
     def __init__(self, db_path=None):
         # Load version info
-        self.version_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "version.json")
+        self.version_file = _VERSION_FILE
         self.version_info = self._load_version_info()
         self.current_version = self.version_info.get("version", "1.0.0")
+        # Parsed once, every update check compares against it
+        self._current_version_parsed = version.parse(self.current_version)
+        # (timestamp, result) of the last conclusive update check
+        self._last_check = None
         self.repo_url = self.version_info.get("repository", "https://github.com/Triotion/wp-scanner")
         self.latest_version_url = self.version_info.get("latest_version_url", 
                                  "https://raw.githubusercontent.com/Triotion/wp-scanner/master/version.json")
@@ -32,70 +84,140 @@ class Updater:
         # Create database directory if it doesn't exist
         if not os.path.exists(self.db_path):
             os.makedirs(self.db_path, exist_ok=True)
+        
+        # HTTP session, created on first use so runs that never touch the
+        # network don't pay for importing the requests stack
+        self._session = None
+    
+    @property
+    def session(self):
+        """Pooled HTTP session shared by every update request"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # One pooled session so the version check and the archive download
+            # reuse the same keep-alive connection instead of new TLS handshakes
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                  max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+    
+    def close(self):
+        """Release the pooled HTTP connections"""
+        if self._session is not None:
+            self._session.close()
     
     def _load_version_info(self):
         """Load version information from version.json file"""
         try:
             if os.path.exists(self.version_file):
-                with open(self.version_file, "r") as f:
-                    return json.load(f)
+                with open(self.version_file, "rb") as f:
+                    return json.loads(f.read())
             else:
-                print(f"{Fore.YELLOW}[!] Version file not found. Using default version.{Style.RESET_ALL}")
+                print(f"{_YELLOW}[!] Version file not found. Using default version.{_RESET}")
                 return {"version": "1.0.0"}
         except Exception as e:
-            print(f"{Fore.RED}[-] Error loading version info: {str(e)}{Style.RESET_ALL}")
+            print(f"{_RED}[-] Error loading version info: {str(e)}{_RESET}")
             return {"version": "1.0.0"}
     
     def _save_version_info(self, version_info):
         """Save version information to version.json file"""
         try:
-            with open(self.version_file, "w") as f:
-                json.dump(version_info, f, indent=4)
+            # Encode in one call and write once instead of streaming small chunks
+            data = json.dumps(version_info, indent=4).encode("utf-8")
+            with open(self.version_file, "wb") as f:
+                f.write(data)
             return True
         except Exception as e:
-            print(f"{Fore.RED}[-] Error saving version info: {str(e)}{Style.RESET_ALL}")
+            print(f"{_RED}[-] Error saving version info: {str(e)}{_RESET}")
             return False
     
+    def _fetch_latest_version(self):
+        """Fetch the latest published version, revalidating the cached copy
+        
+        The ETag/Last-Modified validators of the last successful fetch are kept
+        in version.json, so an unchanged remote answers with a bodyless 304.
+        
+        Returns:
+            tuple: (latest_version, status_code, sha256); latest_version and sha256
+            are None if unavailable. sha256 is the hash published with latest_version
+        """
+        headers = {}
+        if self.version_info.get("cached_latest"):
+            if self.version_info.get("etag"):
+                headers["If-None-Match"] = self.version_info["etag"]
+            if self.version_info.get("last_modified"):
+                headers["If-Modified-Since"] = self.version_info["last_modified"]
+        
+        response = self.session.get(self.latest_version_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            # Unchanged remote, so the stored hash still belongs to the cached release
+            return self.version_info["cached_latest"], response.status_code, self.version_info.get("cached_sha256")
+        if response.status_code != 200:
+            return None, response.status_code, None
+        
+        latest_info = response.json()
+        latest_version = latest_info.get("version", "0.0.0")
+        
+        # Remember the validators so the next check can be conditional
+        self.version_info["cached_latest"] = latest_version
+        self.version_info["cached_sha256"] = latest_info.get("sha256")
+        self.version_info["etag"] = response.headers.get("ETag")
+        self.version_info["last_modified"] = response.headers.get("Last-Modified")
+        self._save_version_info(self.version_info)
+        
+        return latest_version, response.status_code, self.version_info["cached_sha256"]
+    
     def check_for_updates(self):
         """Check if updates are available for the tool
         
         Returns:
             bool: True if updates are available, False otherwise
         """
-        print(f"{Fore.BLUE}[*] Checking for tool updates...{Style.RESET_ALL}")
+        now = time.time()
+        if self._last_check and now - self._last_check[0] < self._check_cache_ttl:
+            return self._last_check[1]
+        
+        import requests
+        
+        print(f"{_BLUE}[*] Checking for tool updates...{_RESET}")
         
         try:
     
-            print(f"{Fore.BLUE}[*] Current version: {self.current_version}{Style.RESET_ALL}")
+            print(f"{_BLUE}[*] Current version: {self.current_version}{_RESET}")
             
             try:
                 # Try to get the latest version info from the repository
-                response = requests.get(self.latest_version_url, timeout=10)
-                if response.status_code == 200:
-                    latest_info = response.json()
-                    latest_version = latest_info.get("version", "0.0.0")
-                    
-                    print(f"{Fore.BLUE}[*] Latest version: {latest_version}{Style.RESET_ALL}")
+                latest_version, status_code, _ = self._fetch_latest_version()
+                if latest_version is not None:
+                    print(f"{_BLUE}[*] Latest version: {latest_version}{_RESET}")
                     
                     # Compare versions using the packaging module
-                    if version.parse(latest_version) > version.parse(self.current_version):
-                        print(f"{Fore.GREEN}[+] New version available: {latest_version}{Style.RESET_ALL}")
-                        return True
+                    update_available = version.parse(latest_version) > self._current_version_parsed
+                    if update_available:
+                        print(f"{_GREEN}[+] New version available: {latest_version}{_RESET}")
                     else:
-                        print(f"{Fore.GREEN}[+] You are running the latest version.{Style.RESET_ALL}")
-                        return False
+                        print(f"{_GREEN}[+] You are running the latest version.{_RESET}")
+                    
+                    # Only a real answer from the remote is worth remembering
+                    self._last_check = (now, update_available)
+                    return update_available
                 else:
                     # If we can't reach the remote, just assume there might be an update
-                    print(f"{Fore.YELLOW}[!] Could not check latest version. Status code: {response.status_code}{Style.RESET_ALL}")
+                    print(f"{_YELLOW}[!] Could not check latest version. Status code: {status_code}{_RESET}")
                     return True
             
             except requests.RequestException as e:
-                print(f"{Fore.YELLOW}[!] Network error checking for updates: {str(e)}{Style.RESET_ALL}")
+                print(f"{_YELLOW}[!] Network error checking for updates: {str(e)}{_RESET}")
                 # For demonstration, we'll simulate that an update is available
                 return True
             
         except Exception as e:
-            print(f"{Fore.RED}[-] Error checking for updates: {str(e)}{Style.RESET_ALL}")
+            print(f"{_RED}[-] Error checking for updates: {str(e)}{_RESET}")
             return False
     
     def _get_user_confirmation(self, message="Do you want to update? (y/n): "):
@@ -106,24 +228,97 @@ class Updater:
         """
         while True:
             try:
-                response = input(f"{Fore.YELLOW}{message}{Style.RESET_ALL}").strip().lower()
+                response = input(f"{_YELLOW}{message}{_RESET}").strip().lower()
                 if response in ["y", "yes"]:
                     return True
                 elif response in ["n", "no"]:
                     return False
                 else:
-                    print(f"{Fore.YELLOW}[!] Please enter 'y' for yes or 'n' for no.{Style.RESET_ALL}")
+                    print(f"{_YELLOW}[!] Please enter 'y' for yes or 'n' for no.{_RESET}")
             except KeyboardInterrupt:
-                print(f"\n{Fore.YELLOW}[!] Update canceled by user.{Style.RESET_ALL}")
+                print(f"\n{_YELLOW}[!] Update canceled by user.{_RESET}")
                 return False
     
+    def _install_from_directory(self, source_dir, current_dir, latest_version):
+        """Install a release from an unpacked source directory over the current one
+        
+        Shared by the git clone and direct download paths. An existing data
+        directory is kept as it is, the release's copy is not installed.
+        
+        Returns:
+            str: The installed version, or None if it could not be determined
+        """
+        import shutil
+        
+        # Move files from the new release to the current directory. The data
+        # directory is left in place, so there is nothing to back up or restore
+        print(f"{_BLUE}[*] Updating files...{_RESET}")
+        # Snapshot the entries first, they are moved out of source_dir below
+        for entry in list(os.scandir(source_dir)):
+            item = entry.name
+            dst_path = os.path.join(current_dir, item)
+            
+            # One lstat tells both whether the target exists and what it is
+            try:
+                dst_mode = os.lstat(dst_path).st_mode
+            except FileNotFoundError:
+                dst_mode = None
+            
+            # Keep user data and the current version info if they exist
+            if item in _PRESERVED_NAMES and dst_mode is not None:
+                continue
+            
+            if item in _SKIP_NAMES or _SKIP_PATTERNS.match(item):
+                continue
+            
+            # Remove existing file/directory
+            if dst_mode is not None:
+                if stat.S_ISDIR(dst_mode):
+                    shutil.rmtree(dst_path)
+                else:
+                    os.remove(dst_path)
+            
+            # Move new file/directory into place
+            os.replace(entry.path, dst_path)
+        
+        # Update version info with the new version
+        try:
+            temp_version_file = os.path.join(source_dir, "version.json")
+            if os.path.exists(temp_version_file):
+                with open(temp_version_file, "rb") as f:
+                    new_version_info = json.loads(f.read())
+                    new_version = new_version_info.get("version", latest_version or "1.0.0")
+                    
+                    # Update our version info
+                    self.version_info["version"] = new_version
+                    self.version_info["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+                    
+                    # Save the updated version info
+                    self._save_version_info(self.version_info)
+                    
+                    # Update the current version
+                    self.current_version = new_version
+                    self._current_version_parsed = version.parse(new_version)
+                    self._last_check = None
+                    return new_version
+        except Exception as e:
+            print(f"{_YELLOW}[!] Error updating version info: {str(e)}{_RESET}")
+        
+        return None
+    
     def update_tool(self):
         """Update the tool to the latest version
         
         Returns:
             dict: Result of the update operation
         """
-        print(f"{Fore.BLUE}[*] Checking for WP-Scanner updates...{Style.RESET_ALL}")
+        # Only needed when actually updating, kept out of module import
+        import subprocess
+        import tempfile
+        import zipfile
+        import requests
+        
+        print(f"{_BLUE}[*] Checking for WP-Scanner updates...{_RESET}")
         
         result = {
             "success": False,
@@ -133,293 +328,184 @@ class Updater:
         }
         
         # First check if update is needed
+        latest_version = None
+        # Only a hash fetched in this run can vouch for the archive; a forced
+        # update after a failed check has none and skips verification
+        expected_sha256 = None
         try:
-            response = requests.get(self.latest_version_url, timeout=10)
-            if response.status_code == 200:
-                latest_info = response.json()
-                latest_version = latest_info.get("version", "0.0.0")
-                
+            latest_version, status_code, expected_sha256 = self._fetch_latest_version()
+            if latest_version is not None:
                 # If no update is needed, return success
-                if version.parse(latest_version) <= version.parse(self.current_version):
+                if version.parse(latest_version) <= self._current_version_parsed:
                     result["success"] = True
                     result["message"] = "Already up to date."
-                    print(f"{Fore.GREEN}[+] Already running the latest version ({self.current_version}).{Style.RESET_ALL}")
+                    print(f"{_GREEN}[+] Already running the latest version ({self.current_version}).{_RESET}")
                     return result
                 
                 # Set the new version for return value
                 result["new_version"] = latest_version
                 
                 # Ask for user confirmation
-                print(f"{Fore.YELLOW}[!] New version ({latest_version}) available. Current version: {self.current_version}{Style.RESET_ALL}")
+                print(f"{_YELLOW}[!] New version ({latest_version}) available. Current version: {self.current_version}{_RESET}")
                 if not self._get_user_confirmation():
                     result["message"] = "Update canceled by user."
-                    print(f"{Fore.YELLOW}[!] Update canceled by user.{Style.RESET_ALL}")
+                    print(f"{_YELLOW}[!] Update canceled by user.{_RESET}")
                     return result
                 
-                print(f"{Fore.BLUE}[*] Updating WP-Scanner...{Style.RESET_ALL}")
+                print(f"{_BLUE}[*] Updating WP-Scanner...{_RESET}")
             else:
-                print(f"{Fore.YELLOW}[!] Could not fetch latest version info. Status code: {response.status_code}{Style.RESET_ALL}")
+                print(f"{_YELLOW}[!] Could not fetch latest version info. Status code: {status_code}{_RESET}")
                 
                 # Ask for forced update
                 if not self._get_user_confirmation("Could not check latest version. Force update anyway? (y/n): "):
                     result["message"] = "Update canceled by user."
-                    print(f"{Fore.YELLOW}[!] Update canceled by user.{Style.RESET_ALL}")
+                    print(f"{_YELLOW}[!] Update canceled by user.{_RESET}")
                     return result
         
         except requests.RequestException as e:
-            print(f"{Fore.YELLOW}[!] Network error fetching latest version: {str(e)}{Style.RESET_ALL}")
+            print(f"{_YELLOW}[!] Network error fetching latest version: {str(e)}{_RESET}")
             
             # Ask for forced update
             if not self._get_user_confirmation("Could not check latest version. Force update anyway? (y/n): "):
                 result["message"] = "Update canceled by user."
-                print(f"{Fore.YELLOW}[!] Update canceled by user.{Style.RESET_ALL}")
+                print(f"{_YELLOW}[!] Update canceled by user.{_RESET}")
                 return result
         
         # Try to update using git clone
         try:
-            print(f"{Fore.BLUE}[*] Updating via git clone...{Style.RESET_ALL}")
+            print(f"{_BLUE}[*] Updating via git clone...{_RESET}")
             
-            # Create a temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Clone the repository to the temporary directory
-                print(f"{Fore.BLUE}[*] Cloning repository from {self.repo_url}...{Style.RESET_ALL}")
+            # Get the current directory (where our tool is installed)
+            current_dir = os.path.dirname(self.version_file)
+            
+            # Create the temporary directory inside the install directory so the
+            # new files can be moved into place with a rename instead of a copy
+            with tempfile.TemporaryDirectory(dir=current_dir, prefix=".update-") as temp_dir:
+                # Clone only the tip of the default branch, without history or tags
+                print(f"{_BLUE}[*] Cloning repository from {self.repo_url}...{_RESET}")
+                clone_env = {"GIT_TERMINAL_PROMPT": "0", **os.environ}
                 clone_process = subprocess.run(
-                    ["git", "clone", self.repo_url, temp_dir],
+                    ["git", "clone", "--depth=1", "--single-branch", "--filter=blob:none",
+                     "--no-tags", self.repo_url, temp_dir],
                     capture_output=True,
                     text=True,
-                    check=False
+                    check=False,
+                    env=clone_env
                 )
                 
+                # Servers without partial clone support reject --filter, retry with a full clone
+                if clone_process.returncode != 0 and "filter" in clone_process.stderr:
+                    clone_process = subprocess.run(
+                        ["git", "clone", self.repo_url, temp_dir],
+                        capture_output=True,
+                        text=True,
+                        check=False,
+                        env=clone_env
+                    )
+                
                 if clone_process.returncode != 0:
-                    print(f"{Fore.RED}[-] Git clone failed: {clone_process.stderr}{Style.RESET_ALL}")
+                    print(f"{_RED}[-] Git clone failed: {clone_process.stderr}{_RESET}")
                     raise subprocess.SubprocessError("Git clone failed")
                 
-                # Get the current directory (where our tool is installed)
-                current_dir = os.path.dirname(self.version_file)
-                
-                # Backup the data directory
-                data_backup_path = None
-                if os.path.exists(os.path.join(current_dir, "data")):
-                    data_backup_path = os.path.join(tempfile.gettempdir(), f"wp_scanner_data_backup_{int(time.time())}")
-                    print(f"{Fore.BLUE}[*] Backing up data directory to {data_backup_path}...{Style.RESET_ALL}")
-                    shutil.copytree(os.path.join(current_dir, "data"), data_backup_path)
-                
-                # Copy files from the cloned repository to the current directory
-                print(f"{Fore.BLUE}[*] Updating files...{Style.RESET_ALL}")
-                for item in os.listdir(temp_dir):
-                    src_path = os.path.join(temp_dir, item)
-                    dst_path = os.path.join(current_dir, item)
-                    
-                    # Skip the data directory to preserve user data
-                    if item == "data" and os.path.exists(dst_path):
-                        continue
-                    
-                    # Skip the version.json file if it exists (keep current version info)
-                    if item == "version.json" and os.path.exists(dst_path):
-                        continue
-                    
-                    # Remove existing file/directory
-                    if os.path.exists(dst_path):
-                        if os.path.isdir(dst_path):
-                            shutil.rmtree(dst_path)
-                        else:
-                            os.remove(dst_path)
-                    
-                    # Copy new file/directory
-                    if os.path.isdir(src_path):
-                        shutil.copytree(src_path, dst_path)
-                    else:
-                        shutil.copy2(src_path, dst_path)
-                
-                # Restore the data directory if it was backed up
-                if data_backup_path and os.path.exists(data_backup_path):
-                    # Only restore files that don't exist in the current data directory
-                    data_dir = os.path.join(current_dir, "data")
-                    if not os.path.exists(data_dir):
-                        os.makedirs(data_dir)
-                    
-                    for root, dirs, files in os.walk(data_backup_path):
-                        # Get relative path from the backup directory
-                        rel_path = os.path.relpath(root, data_backup_path)
-                        
-                        # Create directories in the current data directory
-                        if rel_path != '.':
-                            os.makedirs(os.path.join(data_dir, rel_path), exist_ok=True)
-                        
-                        # Copy files
-                        for file in files:
-                            src_file = os.path.join(root, file)
-                            dst_file = os.path.join(data_dir, rel_path, file)
-                            
-                            # Only copy if file doesn't exist or is a database file
-                            if not os.path.exists(dst_file) or file.endswith("_vulns.json"):
-                                shutil.copy2(src_file, dst_file)
-                
-                # Update version info with the new version
-                try:
-                    temp_version_file = os.path.join(temp_dir, "version.json")
-                    if os.path.exists(temp_version_file):
-                        with open(temp_version_file, "r") as f:
-                            new_version_info = json.load(f)
-                            new_version = new_version_info.get("version", latest_version or "1.0.0")
-                            
-                            # Update our version info
-                            self.version_info["version"] = new_version
-                            self.version_info["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-                            
-                            # Save the updated version info
-                            self._save_version_info(self.version_info)
-                            
-                            # Update the current version
-                            self.current_version = new_version
-                            result["new_version"] = new_version
-                except Exception as e:
-                    print(f"{Fore.YELLOW}[!] Error updating version info: {str(e)}{Style.RESET_ALL}")
+                new_version = self._install_from_directory(temp_dir, current_dir, latest_version)
+                if new_version:
+                    result["new_version"] = new_version
                 
                 # Update successful
                 result["success"] = True
                 result["message"] = f"Successfully updated to version {result['new_version']} via git clone"
-                print(f"{Fore.GREEN}[+] Successfully updated WP-Scanner to version {result['new_version']}{Style.RESET_ALL}")
+                print(f"{_GREEN}[+] Successfully updated WP-Scanner to version {result['new_version']}{_RESET}")
                 
                 return result
                 
         except (subprocess.SubprocessError, FileNotFoundError) as e:
-            print(f"{Fore.YELLOW}[!] Git clone failed: {str(e)}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}[!] Falling back to direct download...{Style.RESET_ALL}")
+            print(f"{_YELLOW}[!] Git clone failed: {str(e)}{_RESET}")
+            print(f"{_YELLOW}[!] Falling back to direct download...{_RESET}")
         
         # If git clone failed, try direct download
         try:
             # Download the latest release zip
             zip_url = f"{self.repo_url}/archive/refs/heads/main.zip"
-            print(f"{Fore.BLUE}[*] Downloading latest version from {zip_url}{Style.RESET_ALL}")
+            print(f"{_BLUE}[*] Downloading latest version from {zip_url}{_RESET}")
             
             try:
-                response = requests.get(zip_url, stream=True, timeout=30)
+                # The archive ETag changes with the commit, skip the download if it didn't
+                headers = {}
+                if self.version_info.get("zip_etag"):
+                    headers["If-None-Match"] = self.version_info["zip_etag"]
+                
+                response = self.session.get(zip_url, headers=headers, stream=True, timeout=30)
+                if response.status_code == 304:
+                    result["success"] = True
+                    result["new_version"] = self.current_version
+                    result["message"] = "Already up to date (archive unchanged)"
+                    print(f"{_GREEN}[+] {result['message']}{_RESET}")
+                    return result
+                
                 if response.status_code != 200:
                     result["message"] = f"Failed to download latest version. Status code: {response.status_code}"
-                    print(f"{Fore.RED}[-] {result['message']}{Style.RESET_ALL}")
+                    print(f"{_RED}[-] {result['message']}{_RESET}")
                     return result
                 
-                # Create a temporary directory for the download
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    # Save the zip file
-                    zip_path = os.path.join(temp_dir, "wp-scanner.zip")
-                    with open(zip_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
+                # Get the current directory (where our tool is installed)
+                current_dir = os.path.dirname(self.version_file)
+                
+                # Create a temporary directory for the download on the same filesystem
+                with tempfile.TemporaryDirectory(dir=current_dir, prefix=".update-") as temp_dir:
+                    # Keep the archive in memory, it is only read once for extraction
+                    buf = io.BytesIO()
+                    for chunk in response.iter_content(chunk_size=65536):
+                        buf.write(chunk)
+                    
+                    # Verify the archive against the published hash; hashing the
+                    # buffer in place is a single C call with no extra copy
+                    if expected_sha256:
+                        digest = hashlib.sha256(buf.getbuffer()).hexdigest()
+                        if digest != expected_sha256.lower():
+                            result["message"] = "Integrity check failed: archive SHA-256 does not match the published hash"
+                            print(f"{_RED}[-] {result['message']}{_RESET}")
+                            return result
+                    buf.seek(0)
                     
-                    print(f"{Fore.BLUE}[*] Extracting files...{Style.RESET_ALL}")
+                    print(f"{_BLUE}[*] Extracting files...{_RESET}")
                     
                     # Extract the zip file
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(temp_dir)
+                    with zipfile.ZipFile(buf, 'r') as zip_ref:
+                        _extract_parallel(zip_ref, temp_dir)
                     
                     # Find the extracted directory (usually repo_name-branch)
                     extracted_dirs = [d for d in os.listdir(temp_dir) if os.path.isdir(os.path.join(temp_dir, d))]
                     if not extracted_dirs:
                         result["message"] = "Extraction failed: No directories found in zip file"
-                        print(f"{Fore.RED}[-] {result['message']}{Style.RESET_ALL}")
+                        print(f"{_RED}[-] {result['message']}{_RESET}")
                         return result
                     
                     extracted_dir = os.path.join(temp_dir, extracted_dirs[0])
                     
-                    # Get the current directory (where our tool is installed)
-                    current_dir = os.path.dirname(self.version_file)
+                    new_version = self._install_from_directory(extracted_dir, current_dir, latest_version)
+                    if new_version:
+                        result["new_version"] = new_version
                     
-                    # Backup the data directory
-                    data_backup_path = None
-                    if os.path.exists(os.path.join(current_dir, "data")):
-                        data_backup_path = os.path.join(tempfile.gettempdir(), f"wp_scanner_data_backup_{int(time.time())}")
-                        print(f"{Fore.BLUE}[*] Backing up data directory to {data_backup_path}...{Style.RESET_ALL}")
-                        shutil.copytree(os.path.join(current_dir, "data"), data_backup_path)
-                    
-                    # Copy all files from the extracted directory to the current directory
-                    print(f"{Fore.BLUE}[*] Updating files...{Style.RESET_ALL}")
-                    for item in os.listdir(extracted_dir):
-                        src_path = os.path.join(extracted_dir, item)
-                        dst_path = os.path.join(current_dir, item)
-                        
-                        # Skip the data directory to preserve user data
-                        if item == "data" and os.path.exists(dst_path):
-                            continue
-                        
-                        # Skip the version.json file if it exists (keep current version info)
-                        if item == "version.json" and os.path.exists(dst_path):
-                            continue
-                        
-                        # Remove existing file/directory
-                        if os.path.exists(dst_path):
-                            if os.path.isdir(dst_path):
-                                shutil.rmtree(dst_path)
-                            else:
-                                os.remove(dst_path)
-                        
-                        # Copy new file/directory
-                        if os.path.isdir(src_path):
-                            shutil.copytree(src_path, dst_path)
-                        else:
-                            shutil.copy2(src_path, dst_path)
-                    
-                    # Restore the data directory if it was backed up
-                    if data_backup_path and os.path.exists(data_backup_path):
-                        # Only restore files that don't exist in the current data directory
-                        data_dir = os.path.join(current_dir, "data")
-                        if not os.path.exists(data_dir):
-                            os.makedirs(data_dir)
-                        
-                        for root, dirs, files in os.walk(data_backup_path):
-                            # Get relative path from the backup directory
-                            rel_path = os.path.relpath(root, data_backup_path)
-                            
-                            # Create directories in the current data directory
-                            if rel_path != '.':
-                                os.makedirs(os.path.join(data_dir, rel_path), exist_ok=True)
-                            
-                            # Copy files
-                            for file in files:
-                                src_file = os.path.join(root, file)
-                                dst_file = os.path.join(data_dir, rel_path, file)
-                                
-                                # Only copy if file doesn't exist or is a database file
-                                if not os.path.exists(dst_file) or file.endswith("_vulns.json"):
-                                    shutil.copy2(src_file, dst_file)
-                    
-                    # Update version info with the new version
-                    try:
-                        temp_version_file = os.path.join(extracted_dir, "version.json")
-                        if os.path.exists(temp_version_file):
-                            with open(temp_version_file, "r") as f:
-                                new_version_info = json.load(f)
-                                new_version = new_version_info.get("version", latest_version or "1.0.0")
-                                
-                                # Update our version info
-                                self.version_info["version"] = new_version
-                                self.version_info["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-                                
-                                # Save the updated version info
-                                self._save_version_info(self.version_info)
-                                
-                                # Update the current version
-                                self.current_version = new_version
-                                result["new_version"] = new_version
-                    except Exception as e:
-                        print(f"{Fore.YELLOW}[!] Error updating version info: {str(e)}{Style.RESET_ALL}")
+                    # Remember which archive is installed for the next conditional download
+                    if response.headers.get("ETag"):
+                        self.version_info["zip_etag"] = response.headers["ETag"]
+                        self._save_version_info(self.version_info)
                     
                     # Update successful
                     result["success"] = True
                     result["message"] = f"Successfully updated to version {result['new_version']} via direct download"
-                    print(f"{Fore.GREEN}[+] Successfully updated WP-Scanner to version {result['new_version']}{Style.RESET_ALL}")
+                    print(f"{_GREEN}[+] Successfully updated WP-Scanner to version {result['new_version']}{_RESET}")
                     
                     return result
             
             except requests.RequestException as e:
                 result["message"] = f"Download failed: {str(e)}"
-                print(f"{Fore.RED}[-] {result['message']}{Style.RESET_ALL}")
+                print(f"{_RED}[-] {result['message']}{_RESET}")
                 return result
         
         except Exception as e:
             result["message"] = f"Unexpected error during update: {str(e)}"
-            print(f"{Fore.RED}[-] {result['message']}{Style.RESET_ALL}")
+            print(f"{_RED}[-] {result['message']}{_RESET}")
             return result
     
     def update_vulnerability_databases(self):
@@ -428,7 +514,9 @@ class Updater:
         Returns:
             dict: Result of the database update operation
         """
-        print(f"{Fore.BLUE}[*] Updating vulnerability databases...{Style.RESET_ALL}")
+        import shutil
+        
+        print(f"{_BLUE}[*] Updating vulnerability databases...{_RESET}")
         
         result = {
             "success": False,
@@ -439,245 +527,75 @@ class Updater:
         try:
             # Create or update the WordPress vulnerabilities database
             wp_vulns_path = os.path.join(self.db_path, "wordpress_vulns.json")
-            print(f"{Fore.BLUE}[*] Checking WordPress vulnerabilities database...{Style.RESET_ALL}")
+            print(f"{_BLUE}[*] Checking WordPress vulnerabilities database...{_RESET}")
             
-            # Load existing data if available
-            existing_wp_data = {}
-            if os.path.exists(wp_vulns_path):
-                try:
-                    with open(wp_vulns_path, 'r') as f:
-                        existing_wp_data = json.load(f)
-                except:
-                    pass
+            # Load existing data if available; a corrupt file is rebuilt
+            try:
+                with open(wp_vulns_path, 'rb') as f:
+                    existing_wp_data = json.loads(f.read())
+            except FileNotFoundError:
+                existing_wp_data = {}
+            except ValueError as e:
+                print(f"{_YELLOW}[!] Corrupt database {os.path.basename(wp_vulns_path)}, rebuilding: {str(e)}{_RESET}")
+                existing_wp_data = {}
             
             # If no data exists or if we want to update it, create new data
             if not existing_wp_data:
-                # WordPress Core vulnerabilities
-                wp_data = {
-                    "wordpress": {
-                        "5.7": [
-                            {
-                                "title": "WordPress Object Injection in PHPMailer",
-                                "description": "WordPress 5.7 is vulnerable to object injection through PHPMailer's use of unserialize().",
-                                "severity": "High",
-                                "cve": "CVE-2021-28931",
-                                "affected_versions": ["<=5.7.0"],
-                                "fixed_in": "5.7.1",
-                                "exploitability": "Medium",
-                                "exploit_available": False,
-                                "exploit_method": None
-                            }
-                        ],
-                        "5.4": [
-                            {
-                                "title": "WordPress XML-RPC Authentication Bypass",
-                                "description": "A vulnerability in WordPress XML-RPC implementation that could allow an attacker to bypass authentication.",
-                                "severity": "Critical",
-                                "cve": "CVE-2020-11027",
-                                "affected_versions": ["<=5.4.1"],
-                                "fixed_in": "5.4.2",
-                                "exploitability": "High",
-                                "exploit_available": True,
-                                "exploit_method": "xmlrpc_multicall"
-                            }
-                        ],
-                        "4.7": [
-                            {
-                                "title": "WordPress REST API Content Injection",
-                                "description": "A vulnerability in the WordPress REST API that could allow for content injection in posts and pages.",
-                                "severity": "Critical",
-                                "cve": "CVE-2017-1001000",
-                                "affected_versions": ["<=4.7.1"],
-                                "fixed_in": "4.7.2",
-                                "exploitability": "High",
-                                "exploit_available": True,
-                                "exploit_method": "rest_api_content_injection"
-                            }
-                        ],
-                        "4.6": [
-                            {
-                                "title": "WordPress Unauthenticated Content Injection",
-                                "description": "A vulnerability allowing unauthenticated users to inject content into WordPress posts.",
-                                "severity": "High",
-                                "cve": "CVE-2016-10033",
-                                "affected_versions": ["<=4.6.0"],
-                                "fixed_in": "4.6.1",
-                                "exploitability": "High",
-                                "exploit_available": True,
-                                "exploit_method": "wp_mail_content_injection"
-                            }
-                        ]
-                    }
-                }
-                
-                # Save the data
-                with open(wp_vulns_path, 'w') as f:
-                    json.dump(wp_data, f, indent=4)
+                # Seed the database from the copy shipped with the tool
+                shutil.copyfile(os.path.join(_SEED_DIR, "_seed_wordpress_vulns.json"), wp_vulns_path)
                 
                 result["updated"].append("wordpress_vulns.json")
-                print(f"{Fore.GREEN}[+] Updated WordPress vulnerabilities database{Style.RESET_ALL}")
+                print(f"{_GREEN}[+] Updated WordPress vulnerabilities database{_RESET}")
             else:
-                print(f"{Fore.GREEN}[+] WordPress vulnerabilities database already exists{Style.RESET_ALL}")
+                print(f"{_GREEN}[+] WordPress vulnerabilities database already exists{_RESET}")
             
             # Create or update the plugins vulnerabilities database
             plugins_vulns_path = os.path.join(self.db_path, "plugins_vulns.json")
-            print(f"{Fore.BLUE}[*] Checking plugins vulnerabilities database...{Style.RESET_ALL}")
+            print(f"{_BLUE}[*] Checking plugins vulnerabilities database...{_RESET}")
             
-            # Load existing data if available
-            existing_plugins_data = {}
-            if os.path.exists(plugins_vulns_path):
-                try:
-                    with open(plugins_vulns_path, 'r') as f:
-                        existing_plugins_data = json.load(f)
-                except:
-                    pass
+            # Load existing data if available; a corrupt file is rebuilt
+            try:
+                with open(plugins_vulns_path, 'rb') as f:
+                    existing_plugins_data = json.loads(f.read())
+            except FileNotFoundError:
+                existing_plugins_data = {}
+            except ValueError as e:
+                print(f"{_YELLOW}[!] Corrupt database {os.path.basename(plugins_vulns_path)}, rebuilding: {str(e)}{_RESET}")
+                existing_plugins_data = {}
             
             # If no data exists or if we want to update it, create new data
             if not existing_plugins_data:
-                # Plugin vulnerabilities
-                plugins_data = {
-                    "contact-form-7": [
-                        {
-                            "title": "Contact Form 7 Unrestricted File Upload",
-                            "description": "Contact Form 7 before 5.3.2 allows unrestricted file upload and remote code execution.",
-                            "severity": "Critical",
-                            "cve": "CVE-2020-35489",
-                            "affected_version": "<=5.3.1",
-                            "fixed_in": "5.3.2",
-                            "exploitability": "High",
-                            "exploit_available": True,
-                            "exploit_method": "cf7_file_upload"
-                        }
-                    ],
-                    "wp-super-cache": [
-                        {
-                            "title": "WP Super Cache Unauthenticated RCE",
-                            "description": "WP Super Cache before 1.7.2 allows unauthenticated remote code execution.",
-                            "severity": "Critical",
-                            "cve": "CVE-2019-20041",
-                            "affected_version": "<=1.7.1",
-                            "fixed_in": "1.7.2",
-                            "exploitability": "High",
-                            "exploit_available": True,
-                            "exploit_method": "wp_super_cache_rce"
-                        }
-                    ],
-                    "woocommerce": [
-                        {
-                            "title": "WooCommerce Arbitrary File Download",
-                            "description": "WooCommerce before 5.5.1 is vulnerable to arbitrary file download.",
-                            "severity": "High",
-                            "cve": "CVE-2021-32620",
-                            "affected_version": "<=5.5.0",
-                            "fixed_in": "5.5.1",
-                            "exploitability": "Medium",
-                            "exploit_available": True,
-                            "exploit_method": "woocommerce_file_download"
-                        }
-                    ],
-                    "wp-file-manager": [
-                        {
-                            "title": "WP File Manager Remote Code Execution",
-                            "description": "Unauthenticated remote code execution in WP File Manager before 6.9.",
-                            "severity": "Critical",
-                            "cve": "CVE-2020-25213",
-                            "affected_version": "<=6.8",
-                            "fixed_in": "6.9",
-                            "exploitability": "High",
-                            "exploit_available": True,
-                            "exploit_method": "wp_file_manager_rce"
-                        }
-                    ],
-                    "wpdatatables": [
-                        {
-                            "title": "wpDataTables SQL Injection Vulnerability",
-                            "description": "SQL injection vulnerability in wpDataTables plugin before 3.7.1.",
-                            "severity": "Critical",
-                            "cve": "CVE-2023-26540",
-                            "affected_version": "<=3.7.0",
-                            "fixed_in": "3.7.1",
-                            "exploitability": "High",
-                            "exploit_available": True,
-                            "exploit_method": "wpdatatables_sqli"
-                        }
-                    ]
-                }
-                
-                # Save the data
-                with open(plugins_vulns_path, 'w') as f:
-                    json.dump(plugins_data, f, indent=4)
+                # Seed the database from the copy shipped with the tool
+                shutil.copyfile(os.path.join(_SEED_DIR, "_seed_plugins_vulns.json"), plugins_vulns_path)
                 
                 result["updated"].append("plugins_vulns.json")
-                print(f"{Fore.GREEN}[+] Updated plugins vulnerabilities database{Style.RESET_ALL}")
+                print(f"{_GREEN}[+] Updated plugins vulnerabilities database{_RESET}")
             else:
-                print(f"{Fore.GREEN}[+] Plugins vulnerabilities database already exists{Style.RESET_ALL}")
+                print(f"{_GREEN}[+] Plugins vulnerabilities database already exists{_RESET}")
             
             # Create or update the themes vulnerabilities database
             themes_vulns_path = os.path.join(self.db_path, "themes_vulns.json")
-            print(f"{Fore.BLUE}[*] Checking themes vulnerabilities database...{Style.RESET_ALL}")
+            print(f"{_BLUE}[*] Checking themes vulnerabilities database...{_RESET}")
             
-            # Load existing data if available
-            existing_themes_data = {}
-            if os.path.exists(themes_vulns_path):
-                try:
-                    with open(themes_vulns_path, 'r') as f:
-                        existing_themes_data = json.load(f)
-                except:
-                    pass
+            # Load existing data if available; a corrupt file is rebuilt
+            try:
+                with open(themes_vulns_path, 'rb') as f:
+                    existing_themes_data = json.loads(f.read())
+            except FileNotFoundError:
+                existing_themes_data = {}
+            except ValueError as e:
+                print(f"{_YELLOW}[!] Corrupt database {os.path.basename(themes_vulns_path)}, rebuilding: {str(e)}{_RESET}")
+                existing_themes_data = {}
             
             # If no data exists or if we want to update it, create new data
             if not existing_themes_data:
-                # Theme vulnerabilities
-                themes_data = {
-                    "twentytwenty": [
-                        {
-                            "title": "Twenty Twenty Theme XSS Vulnerability",
-                            "description": "Cross-site scripting vulnerability in Twenty Twenty theme before 1.5.",
-                            "severity": "Medium",
-                            "cve": "CVE-2020-11026",
-                            "affected_version": "<=1.4",
-                            "fixed_in": "1.5",
-                            "exploitability": "Medium",
-                            "exploit_available": False,
-                            "exploit_method": None
-                        }
-                    ],
-                    "divi": [
-                        {
-                            "title": "Divi Theme Authenticated RCE",
-                            "description": "Authenticated remote code execution vulnerability in Divi theme before 4.5.3.",
-                            "severity": "Critical",
-                            "cve": "CVE-2020-16843",
-                            "affected_version": "<=4.5.2",
-                            "fixed_in": "4.5.3",
-                            "exploitability": "High",
-                            "exploit_available": False,
-                            "exploit_method": None
-                        }
-                    ],
-                    "avada": [
-                        {
-                            "title": "Avada Theme Authenticated File Upload",
-                            "description": "Authenticated file upload vulnerability in Avada theme before 6.2.3.",
-                            "severity": "High",
-                            "cve": "CVE-2020-14715",
-                            "affected_version": "<=6.2.2",
-                            "fixed_in": "6.2.3",
-                            "exploitability": "Medium",
-                            "exploit_available": False,
-                            "exploit_method": None
-                        }
-                    ]
-                }
-                
-                # Save the data
-                with open(themes_vulns_path, 'w') as f:
-                    json.dump(themes_data, f, indent=4)
+                # Seed the database from the copy shipped with the tool
+                shutil.copyfile(os.path.join(_SEED_DIR, "_seed_themes_vulns.json"), themes_vulns_path)
                 
                 result["updated"].append("themes_vulns.json")
-                print(f"{Fore.GREEN}[+] Updated themes vulnerabilities database{Style.RESET_ALL}")
+                print(f"{_GREEN}[+] Updated themes vulnerabilities database{_RESET}")
             else:
-                print(f"{Fore.GREEN}[+] Themes vulnerabilities database already exists{Style.RESET_ALL}")
+                print(f"{_GREEN}[+] Themes vulnerabilities database already exists{_RESET}")
             
             # Set success flag
             if result["updated"]:
@@ -689,7 +607,7 @@ class Updater:
             
         except Exception as e:
             result["message"] = f"Error updating databases: {str(e)}"
-            print(f"{Fore.RED}[-] Error updating vulnerability databases: {str(e)}{Style.RESET_ALL}")
+            print(f"{_RED}[-] Error updating vulnerability databases: {str(e)}{_RESET}")
         
         return result
     
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 
+import bisect
 import concurrent.futures
+import functools
 import json
+import operator
 import os
+import pickle
 import re
 import sys
+import tempfile
+import threading
 from urllib.parse import urljoin
-from packaging import version
+from packaging import version, __version__ as _packaging_version
 from tqdm import tqdm
 
 import requests
@@ -14,65 +20,317 @@ from bs4 import BeautifulSoup
 
 from modules.utils import print_info, print_success, print_error, print_warning, print_verbose
 
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+_DB_FILE = os.path.join(_DATA_DIR, 'vulnerability_db.json')
+# Pickled index of _DB_FILE, tagged with the JSON's mtime/size it was built from
+_INDEX_FILE = _DB_FILE + '.idx'
+_INDEX_FORMAT = 2
+_DOTTED = re.compile(r'\d+(?:\.\d+)*')
+
+# The same handful of version strings recur across every plugin, theme and
+# CVE entry, so each distinct string is parsed only once per process.
+@functools.lru_cache(maxsize=4096)
+def _parse_version(value):
+    """Memoised packaging.version.parse."""
+    return version.parse(value)
+
+@functools.lru_cache(maxsize=4096)
+def _fast_parse(value):
+    """Parse a version into a comparison key.
+
+    Plain dotted integers ("3.7.0", "6.8") become int tuples with trailing
+    zeros dropped, which order exactly like packaging's release segment and
+    compare far faster than Version objects. Anything else (pre-releases,
+    local versions) falls back to packaging.version.parse.
+    """
+    if _DOTTED.fullmatch(value):
+        key = tuple(map(int, value.split('.')))
+        while len(key) > 1 and key[-1] == 0:
+            key = key[:-1]
+        return key
+    return _parse_version(value)
+
+@functools.lru_cache(maxsize=4096)
+def _as_version(key):
+    """Turn a _fast_parse key back into a Version for mixed comparisons."""
+    if type(key) is tuple:
+        return version.Version('.'.join(map(str, key)))
+    return key
+
+# Prefix operators in checking order ('<=' before '<'), resolved once at load
+_OPS = (('<=', operator.le), ('<', operator.lt), ('>=', operator.ge), ('>', operator.gt))
+_OPEN_ENDED = (operator.ge, operator.gt)
+# Op slot of an inclusive "start-end" range
+_RANGE = None
+
+@functools.lru_cache(maxsize=4096)
+def _parse_range(ver_range):
+    """Split an affected-versions entry into (op_fn, key) or (_RANGE, start, end)."""
+    if '-' in ver_range:
+        start_ver, end_ver = ver_range.split('-')
+        return (_RANGE, _fast_parse(start_ver), _fast_parse(end_ver))
+    for prefix, op in _OPS:
+        if ver_range.startswith(prefix):
+            return (op, _fast_parse(ver_range[len(prefix):]))
+    return (operator.eq, _fast_parse(ver_range))
+
+def _compile_ranges(affected_versions):
+    """Pre-parse an affected_versions list into a tuple of _parse_range results.
+
+    Matching has always stopped at the first unparsable entry, so the tuple
+    is cut there.
+    """
+    ranges = []
+    for ver_range in affected_versions or ():
+        try:
+            ranges.append(_parse_range(ver_range))
+        except (version.InvalidVersion, ValueError, TypeError):
+            # ValueError covers malformed ranges such as '1.0-beta-2.0'
+            break
+    return tuple(ranges)
+
+# Parsed and indexed database, keyed on (path, mtime_ns, size) so scanners built
+# for later targets reuse it until the file changes. Read-only once stored.
+_DB_CACHE = {}
+# Held while a cache miss loads or builds the index, so concurrent scanners build it once
+_DB_LOCK = threading.Lock()
+
+def _max_affected(ranges):
+    """Highest version any of the ranges can match, or None when unbounded.
+
+    Only int-tuple bounds are combined; a range with a packaging fallback
+    bound or an open upper end (">", ">=") leaves the entry unbounded.
+    """
+    top = None
+    for op, bound, *upper in ranges:
+        if op in _OPEN_ENDED:
+            return None
+        bound = upper[0] if op is _RANGE else bound
+        if type(bound) is not tuple:
+            return None
+        if top is None or bound > top:
+            top = bound
+    return top
+
+def _affected_ranges(vuln):
+    """Affected-version entries of a vulnerability as a list.
+
+    Plugin and theme entries written by the updater carry a single
+    "affected_version" string instead of an "affected_versions" list.
+    """
+    affected = vuln.get("affected_versions")
+    if affected is None:
+        single = vuln.get("affected_version")
+        affected = [single] if isinstance(single, str) else None
+    return affected
+
+def _index_vulns(vuln_list):
+    """Pre-parse each vulnerability's ranges: [(ranges, max_affected, vuln), ...]."""
+    indexed = []
+    for vuln in vuln_list:
+        ranges = _compile_ranges(_affected_ranges(vuln))
+        indexed.append((ranges, _max_affected(ranges), vuln))
+    return indexed
+
+def _read_index(key):
+    """Load the pickled index if it was built from the database identified by key."""
+    try:
+        with open(_INDEX_FILE, 'rb') as f:
+            tag, indexed = pickle.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated, foreign or built against another packaging release
+        return None
+    if tag != (_INDEX_FORMAT, _packaging_version, key[1:]):
+        return None
+    return indexed
+
+def _write_index(key, indexed):
+    """Save the index next to the database; failing to cache is not an error."""
+    tmp_file = None
+    try:
+        # A name unique per call, so concurrent writers never share a temp file
+        fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(_INDEX_FILE),
+                                        prefix=os.path.basename(_INDEX_FILE) + '.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pickle.dumps(((_INDEX_FORMAT, _packaging_version, key[1:]), indexed),
+                                 protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, _INDEX_FILE)
+    except OSError:
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
 class VulnerabilityScanner:
-    def __init__(self, session, target, headers, timeout, threads, output_dir):
+    # Per-item progress bars cost more than offline matching itself, so the
+    # plugin/theme bars only show in verbose mode and for longer lists
+    _pbar_min_items = 20
+    # Rebuilt per process rather than pickled; see __getstate__
+    _process_local = ('session', '_executor', 'wp_vulns_db', 'plugin_vulns_db',
+                      'theme_vulns_db', '_wp_sorted', '_wp_keys')
+
+    def __init__(self, session, target, headers, timeout, threads, output_dir, verbose=False, executor=None):
         self.session = session
         self.target = target
         self.headers = headers
         self.timeout = timeout
         self.threads = threads
         self.output_dir = output_dir
-        self.wp_vulns_db, self.plugin_vulns_db, self.theme_vulns_db = self._load_vulns_db()
+        self.verbose = verbose
+        # A caller-supplied executor is shared with other scanners and left running on close()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._init_process_state()
+
+    def _init_process_state(self):
+        """Load the indexed database and start the worker pool."""
+        (self.wp_vulns_db, self.plugin_vulns_db, self.theme_vulns_db,
+         self._wp_sorted, self._wp_keys) = self._load_vulns_db()
+        # One pool for every check; nested per-call pools could grow to threads² workers
+        if self._owns_executor:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.threads)
+
+    def __getstate__(self):
+        """Pickle only the scan configuration.
+
+        Sessions and executors cannot be pickled, and shipping the indexed
+        database to every worker would cost more than loading it there from
+        the process cache or the index sidecar.
+        """
+        state = self.__dict__.copy()
+        for name in self._process_local:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Each worker process gets its own session
+        self.session = requests.Session()
+        if self.headers:
+            self.session.headers.update(self.headers)
+        self._owns_executor = True
+        self._init_process_state()
+
+    def close(self):
+        """Shut down the worker pool if this scanner created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _load_vulns_db(self):
-        """Load vulnerability database from file."""
-        db_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'vulnerability_db.json')
-        if not os.path.exists(db_file):
-            os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        """Load vulnerability database from file and index it for matching.
+
+        Returns (wp_vulns_db, plugin_vulns_db, theme_vulns_db, wp_sorted, wp_keys),
+        where the plugin and theme databases map names to [(ranges, max_affected, vuln), ...].
+        """
+        db_file = _DB_FILE
+        try:
+            st = os.stat(db_file)
+        except FileNotFoundError:
+            os.makedirs(_DATA_DIR, exist_ok=True)
             with open(db_file, 'w') as f:
                 json.dump({"wordpress": {}, "plugins": {}, "themes": {}}, f)
-            return {}, {}, {}
-        try:
-            with open(db_file, 'r') as f:
-                db = json.load(f)
-                return db.get("wordpress", {}), db.get("plugins", {}), db.get("themes", {})
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            print_error(f"Error loading vulnerability database: {e}")
-            return {}, {}, {}
+            return {}, {}, {}, [], []
+
+        key = (db_file, st.st_mtime_ns, st.st_size)
+        cached = _DB_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        # Cold mass scans start many scanners at once; the first to take the
+        # lock builds the index and the rest pick it up from the cache
+        with _DB_LOCK:
+            cached = _DB_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+            # A fresh sidecar skips both the JSON decode and the range pre-parsing
+            indexed = _read_index(key)
+            if indexed is None:
+                try:
+                    # One read and one C-level decode instead of text-mode streaming
+                    with open(db_file, 'rb') as f:
+                        db = json.loads(f.read())
+                except (ValueError, FileNotFoundError) as e:
+                    print_error(f"Error loading vulnerability database: {e}")
+                    return {}, {}, {}, [], []
+
+                wp_vulns_db = db.get("wordpress", {})
+                indexed = (
+                    wp_vulns_db,
+                    {name: _index_vulns(vulns) for name, vulns in db.get("plugins", {}).items()},
+                    {name: _index_vulns(vulns) for name, vulns in db.get("themes", {}).items()},
+                    *self._index_wp_vulns(wp_vulns_db),
+                )
+                _write_index(key, indexed)
+            # Only the current version of the file is worth keeping
+            _DB_CACHE.clear()
+            _DB_CACHE[key] = indexed
+        return indexed
+
+    def _index_wp_vulns(self, wp_vulns_db):
+        """Sort core vulnerability lists by the version they are filed under.
+
+        Returns (sorted [(Version, [(ranges, max_affected, vuln), ...])], [Version]) so that
+        check_wp_vulns can bisect to the first entry at or above the detected version.
+        """
+        # Older databases nest the versions one level deeper under "wordpress"
+        entries = wp_vulns_db.get('wordpress', wp_vulns_db)
+        indexed = []
+        for vuln_version, vuln_list in entries.items():
+            try:
+                indexed.append((_parse_version(vuln_version), _index_vulns(vuln_list)))
+            except (version.InvalidVersion, TypeError):
+                continue
+        indexed.sort(key=lambda entry: entry[0])
+        return indexed, [entry[0] for entry in indexed]
 
     def scan(self, wp_info):
         """
-        Scan WordPress for vulnerabilities concurrently.
+        Scan WordPress for vulnerabilities.
+
+        The core check and every plugin and theme check run as flat tasks.
+        Matching against the local database is pure in-memory work, which the
+        GIL would serialise on a pool anyway, so the tasks run inline.
         """
         results = {"core": [], "plugins": {}, "themes": {}}
-        with tqdm(total=3, desc="Scanning for vulnerabilities") as pbar:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-                future_to_scan = {
-                    executor.submit(self.check_wp_vulns, wp_info.get("version")): "core",
-                    executor.submit(self.check_plugin_vulns, wp_info.get("plugins")): "plugins",
-                    executor.submit(self.check_theme_vulns, wp_info.get("themes")): "themes"
-                }
-
-                for future in concurrent.futures.as_completed(future_to_scan):
-                    scan_type = future_to_scan[future]
-                    try:
-                        data = future.result()
-                        if data:
-                            if scan_type == "core":
-                                results["core"] = data
-                            elif scan_type == "plugins":
-                                for plugin, vulns in data.items():
-                                    if vulns:
-                                        results["plugins"][plugin] = vulns
-                            elif scan_type == "themes":
-                                for theme, vulns in data.items():
-                                    if vulns:
-                                        results["themes"][theme] = vulns
-                    except Exception as exc:
-                        print_error(f'{scan_type} scan generated an exception: {exc}')
-                    pbar.update(1)
+        checks = [(self.check_wp_vulns, (wp_info.get("version"),), ("core", None))]
+        checks.extend(self._plugin_checks(wp_info.get("plugins")))
+        checks.extend(self._theme_checks(wp_info.get("themes")))
+        with tqdm(total=len(checks), desc="Scanning for vulnerabilities", mininterval=0.5) as pbar:
+            self._run_checks(checks, results, pbar)
         return results
 
+    def _run_checks(self, checks, results, pbar):
+        """Run (func, args, (scan_type, name)) checks and store their results."""
+        for func, args, tag in checks:
+            self._store_result(results, tag, lambda: func(*args))
+            pbar.update(1)
+
+    def _store_result(self, results, tag, get_result):
+        """Store one check result in results, keyed by its (scan_type, name) tag."""
+        scan_type, name = tag
+        try:
+            data = get_result()
+            if data:
+                if name is None:
+                    results[scan_type] = data
+                else:
+                    results[scan_type][name] = data
+        except Exception as exc:
+            if name is None:
+                print_error(f'{scan_type} scan generated an exception: {exc}')
+            else:
+                print_error(f'{"Plugin" if scan_type == "plugins" else "Theme"} {name} generated an exception: {exc}')
+
     def check_wp_vulns(self, wp_version):
         """Check WordPress core vulnerabilities."""
         if not wp_version or wp_version == 'Unknown':
@@ -80,12 +338,11 @@ class VulnerabilityScanner:
             return []
         
         vulns = []
-        if 'wordpress' in self.wp_vulns_db:
-            for vuln_version, vuln_list in self.wp_vulns_db['wordpress'].items():
-                if version.parse(wp_version) <= version.parse(vuln_version):
-                    for vuln in vuln_list:
-                        if self._is_version_affected(wp_version, vuln.get("affected_versions")):
-                            vulns.append(vuln)
+        parsed_version = _fast_parse(wp_version)
+        # Only lists filed under a version >= wp_version can apply
+        start = bisect.bisect_left(self._wp_keys, _as_version(parsed_version))
+        for _, vuln_list in self._wp_sorted[start:]:
+            vulns.extend(self._match_entries(parsed_version, vuln_list))
         vulns.extend(self._check_wp_common_vulns())
         return vulns
 
@@ -98,89 +355,101 @@ class VulnerabilityScanner:
         """Check plugin vulnerabilities."""
         if not plugins:
             return {}
-        
-        vulns = {}
-        with tqdm(total=len(plugins), desc="Scanning plugins", leave=False) as pbar:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-                future_to_plugin = {executor.submit(self._check_plugin_vuln, plugin_name, plugin_info): plugin_name for plugin_name, plugin_info in plugins.items()}
-                for future in concurrent.futures.as_completed(future_to_plugin):
-                    plugin_name = future_to_plugin[future]
-                    try:
-                        plugin_vulns = future.result()
-                        if plugin_vulns:
-                            vulns[plugin_name] = plugin_vulns
-                    except Exception as exc:
-                        print_error(f'Plugin {plugin_name} generated an exception: {exc}')
-                    pbar.update(1)
-        return vulns
+
+        results = {"plugins": {}}
+        with self._progress(plugins, "Scanning plugins") as pbar:
+            self._run_checks(self._plugin_checks(plugins), results, pbar)
+        return results["plugins"]
+
+    def _progress(self, items, desc):
+        """Throttled progress bar, disabled for short lists or outside verbose mode."""
+        return tqdm(total=len(items), desc=desc, leave=False, mininterval=0.5, miniters=10,
+                    disable=not self.verbose or len(items) < self._pbar_min_items)
+
+    def _plugin_checks(self, plugins):
+        """One check task per plugin."""
+        if not plugins:
+            return []
+        return [(self._check_plugin_vuln, (plugin_name, plugin_info), ("plugins", plugin_name))
+                for plugin_name, plugin_info in plugins.items()]
 
     def _check_plugin_vuln(self, plugin_name, plugin_info):
         """Check a single plugin for vulnerabilities."""
-        vulns = []
-        plugin_version = plugin_info.get("version", "Unknown")
-        if plugin_name in self.plugin_vulns_db:
-            for vuln in self.plugin_vulns_db[plugin_name]:
-                if self._is_version_affected(plugin_version, vuln.get("affected_versions")):
-                    vulns.append(vuln)
-        return vulns
+        detected_version = plugin_info.get("version", "Unknown")
+        # Un-fingerprinted components are the common case; skip them before any lookup
+        if detected_version == "Unknown":
+            return []
+        entries = self.plugin_vulns_db.get(plugin_name, ())
+        if not entries:
+            return []
+        parsed_version = self._parse_detected(detected_version)
+        if parsed_version is None:
+            return []
+        return self._match_entries(parsed_version, entries)
 
     def check_theme_vulns(self, themes):
         """Check theme vulnerabilities."""
         if not themes:
             return {}
 
-        vulns = {}
-        with tqdm(total=len(themes), desc="Scanning themes", leave=False) as pbar:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-                future_to_theme = {executor.submit(self._check_theme_vuln, theme.get("name"), theme): theme.get("name") for theme in themes}
-                for future in concurrent.futures.as_completed(future_to_theme):
-                    theme_name = future_to_theme[future]
-                    try:
-                        theme_vulns = future.result()
-                        if theme_vulns:
-                            vulns[theme_name] = theme_vulns
-                    except Exception as exc:
-                        print_error(f'Theme {theme_name} generated an exception: {exc}')
-                    pbar.update(1)
-        return vulns
+        results = {"themes": {}}
+        with self._progress(themes, "Scanning themes") as pbar:
+            self._run_checks(self._theme_checks(themes), results, pbar)
+        return results["themes"]
+
+    def _theme_checks(self, themes):
+        """One check task per theme."""
+        if not themes:
+            return []
+        checks = []
+        for i, theme in enumerate(themes):
+            # Unnamed themes get a unique key so their results don't collide
+            name = theme.get("name") or f"<unnamed#{i}>"
+            checks.append((self._check_theme_vuln, (name, theme), ("themes", name)))
+        return checks
 
     def _check_theme_vuln(self, theme_name, theme_info):
         """Check a single theme for vulnerabilities."""
-        vulns = []
-        theme_version = theme_info.get("version", "Unknown")
-        if theme_name in self.theme_vulns_db:
-            for vuln in self.theme_vulns_db[theme_name]:
-                if self._is_version_affected(theme_version, vuln.get("affected_versions")):
-                    vulns.append(vuln)
-        return vulns
+        detected_version = theme_info.get("version", "Unknown")
+        # Un-fingerprinted components are the common case; skip them before any lookup
+        if detected_version == "Unknown":
+            return []
+        entries = self.theme_vulns_db.get(theme_name, ())
+        if not entries:
+            return []
+        parsed_version = self._parse_detected(detected_version)
+        if parsed_version is None:
+            return []
+        return self._match_entries(parsed_version, entries)
 
-    def _is_version_affected(self, detected_version, affected_versions):
-        """Check if a detected version is within the affected version ranges."""
-        if detected_version == "Unknown" or not affected_versions:
-            return False
-        
+    def _parse_detected(self, detected_version):
+        """Parse a detected version, or None when it is unknown or unparsable."""
+        if detected_version == "Unknown":
+            return None
         try:
-            parsed_version = version.parse(detected_version)
-            for ver_range in affected_versions:
-                if '-' in ver_range:
-                    start_ver, end_ver = ver_range.split('-')
-                    if version.parse(start_ver) <= parsed_version <= version.parse(end_ver):
-                        return True
-                elif ver_range.startswith('<='):
-                    if parsed_version <= version.parse(ver_range[2:]):
-                        return True
-                elif ver_range.startswith('<'):
-                    if parsed_version < version.parse(ver_range[1:]):
-                        return True
-                elif ver_range.startswith('>='):
-                    if parsed_version >= version.parse(ver_range[2:]):
-                        return True
-                elif ver_range.startswith('>'):
-                    if parsed_version > version.parse(ver_range[1:]):
-                        return True
-                else:
-                    if parsed_version == version.parse(ver_range):
-                        return True
+            return _fast_parse(detected_version)
         except (version.InvalidVersion, TypeError):
-            return False
-        return False
\ No newline at end of file
+            return None
+
+    def _match_entries(self, parsed_version, entries):
+        """Return the vulnerabilities among indexed entries that affect parsed_version."""
+        # Anything newer than an entry's highest bound is skipped with one tuple compare
+        fast = type(parsed_version) is tuple
+        return [vuln for ranges, top, vuln in entries
+                if not (fast and top is not None and parsed_version > top)
+                and self._is_version_affected(parsed_version, ranges)]
+
+    def _is_version_affected(self, parsed_version, ranges):
+        """Check if a parsed version is within the pre-parsed affected ranges."""
+        for op, bound, *upper in ranges:
+            value = parsed_version
+            # Int tuples and Versions do not compare with each other
+            if type(bound) is not type(value) or (upper and type(upper[0]) is not type(value)):
+                value, bound = _as_version(value), _as_version(bound)
+                upper = [_as_version(u) for u in upper]
+            if op is _RANGE:
+                if bound <= value <= upper[0]:
+                    return True
+            elif op(value, bound):
+                return True
+        return False
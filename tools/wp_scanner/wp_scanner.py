@@ -5,25 +5,23 @@ import argparse
 import concurrent.futures
 import json
 import os
-import re
+import socket
 import sys
-import time
 from datetime import datetime
-from urllib.parse import urlparse, urljoin
-from threading import Lock, Semaphore
+from urllib.parse import urlparse
+from threading import Lock
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from colorama import init, Fore, Style
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.request import ACCEPT_ENCODING
 
-
-from modules.fingerprinter import WPFingerprinter
-from modules.vuln_scanner import VulnerabilityScanner
-from modules.exploiter import Exploiter
-
+# The scanner modules (and bs4, packaging, tqdm behind them) are imported where
+# a scan is actually built, so --help and argument errors return immediately
 from modules.utils import banner, Logger, create_directory, print_info, print_success, print_error, print_warning
-from modules.reporter import Reporter
 
 
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
@@ -31,8 +29,77 @@ requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
 init()
 
+# Fixed pieces of the console report, built once rather than on every report
+_SEP = "=" * 80
+_WP_INFO_HEADER = f"\n{Fore.BLUE}WordPress Information:{Style.RESET_ALL}"
+_VULNS_HEADER = f"\n{Fore.RED}Vulnerabilities Found:{Style.RESET_ALL}"
+_CORE_HEADER = f"  {Fore.YELLOW}Core:{Style.RESET_ALL}"
+_PLUGINS_HEADER = f"  {Fore.YELLOW}Plugins:{Style.RESET_ALL}"
+_THEMES_HEADER = f"  {Fore.YELLOW}Themes:{Style.RESET_ALL}"
+# Mass-scan summary file layout
+_SUMMARY_HEADER = (
+    "WP-Scanner Mass Scan Summary\n"
+    "Date: {date}\n"
+    "Total Targets: {total}\n"
+    "Threads: {threads}\n\n"
+    + _SEP + "\n\n"
+)
+_SUMMARY_RULE = "\n" + "-" * 80 + "\n\n"
+
+def _write_json(path, data):
+    """Encode data in one call and write it with a single write()."""
+    payload = json.dumps(data, indent=4).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+# Transient gateway errors are retried briefly; the last response is still
+# returned rather than raised once retries run out
+_RETRY = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False)
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets also enable SO_KEEPALIVE.
+
+    urllib3 already sets TCP_NODELAY by default; keepalive lets connections
+    that sit pooled between targets of a mass scan notice a dead peer.
+    """
+    _socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self._socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault('socket_options', self._socket_options)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+def create_session(threads, proxy=None, pool_connections=10, max_retries=_RETRY):
+    """Build a keep-alive session whose pools fit the scanner's concurrency.
+
+    pool_connections is the number of hosts kept pooled at once; each host
+    gets one connection per concurrent probe, so the fingerprint checks never
+    fall back to opening throwaway sockets.
+    """
+    from modules.fingerprinter import WPFingerprinter
+
+    session = requests.Session()
+    session.keep_alive = True
+    adapter = _KeepAliveAdapter(pool_connections=pool_connections,
+                          pool_maxsize=max(threads, WPFingerprinter.MAX_WORKERS),
+                          max_retries=max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if proxy:
+        session.proxies = {
+            'http': proxy,
+            'https': proxy
+        }
+    return session
+
 class WPScanner:
-    def __init__(self, args):
+    # Serialises console reports from concurrent mass-scan workers
+    _stdout_lock = Lock()
+
+    def __init__(self, args, session=None, executor=None):
         self.target = args.target
         self.output_dir = args.output
         self.threads = args.threads
@@ -43,7 +110,14 @@ class WPScanner:
         self.verbose = args.verbose
         self.auto_update = args.auto_update
         self.report_format = args.report_format
-        self.scan_lock = Lock()  
+        self.compress_report = args.compress_report
+        self.scan_lock = Lock()
+        # Result of the last vulnerability scan, kept for MassScanner's summary
+        self.last_vulnerabilities = None
+        # Built on first use, so targets that turn out not to be WordPress skip them
+        self._vuln_scanner = None
+        self._exploiter = None
+        self._reporter = None  
         
         
 
@@ -58,63 +132,95 @@ class WPScanner:
                 self.target = 'http://' + self.target
             
             
-            if self.target.endswith('/'):
-                self.target = self.target[:-1]
+            self.target = self.target.rstrip('/')
+            self.netloc = urlparse(self.target).netloc
                 
             
             if self.output_dir:
                 create_directory(self.output_dir)
                 self.logger = Logger(os.path.join(self.output_dir, 'scan_results.log'))
             else:
-                domain = urlparse(self.target).netloc
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                self.output_dir = f"results_{domain}_{timestamp}"
+                self.output_dir = f"results_{self.netloc}_{timestamp}"
                 create_directory(self.output_dir)
                 self.logger = Logger(os.path.join(self.output_dir, 'scan_results.log'))
             
             
-            self.session = requests.Session()
-            self.session.keep_alive = True  
-            if self.proxy:
-                self.session.proxies = {
-                    'http': self.proxy,
-                    'https': self.proxy
-                }
+            # A mass scan hands in one shared session so pooled connections
+            # and adapters survive from one target to the next
+            self.session = session if session is not None else create_session(self.threads, self.proxy)
             
             
             self.headers = {
                 'User-Agent': self.user_agent,
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
+                # Advertises br only when a brotli decoder is installed
+                'Accept-Encoding': ACCEPT_ENCODING,
                 'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1'
             }
+            # Defaults for any request that does not pass its own headers
+            self.session.headers.update(self.headers)
+            # One pool for the concurrent vulnerability checks; a mass scan
+            # shares its own across all targets instead
+            self._owns_executor = executor is None
+            self.executor = executor if executor is not None else concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix=f"wp-{self.netloc}")
             
             
+            from modules.fingerprinter import WPFingerprinter
+
             self.fingerprinter = WPFingerprinter(self.session, self.target, self.headers, self.timeout, self.output_dir, self.threads)
-            self.vuln_scanner = VulnerabilityScanner(self.session, self.target, self.headers, self.timeout, self.threads, self.output_dir)
-            self.exploiter = Exploiter(self.session, self.target, self.headers, self.timeout, self.output_dir)
-            self.reporter = Reporter(self.output_dir, self.target)
-    
 
-        
+    @property
+    def vuln_scanner(self):
+        """Vulnerability scanner, created when a WordPress site needs matching."""
+        if self._vuln_scanner is None:
+            from modules.vuln_scanner import VulnerabilityScanner
+            self._vuln_scanner = VulnerabilityScanner(self.session, self.target, self.headers, self.timeout, self.threads, self.output_dir, self.verbose, executor=self.executor)
+        return self._vuln_scanner
+
+    @property
+    def exploiter(self):
+        """Exploiter, created only when there is something to exploit."""
+        if self._exploiter is None:
+            from modules.exploiter import Exploiter
+            self._exploiter = Exploiter(self.session, self.target, self.headers, self.timeout, self.output_dir)
+        return self._exploiter
+
+    @property
+    def reporter(self):
+        """Report writer, created when a report is generated."""
+        if self._reporter is None:
+            from modules.reporter import Reporter
+            self._reporter = Reporter(self.output_dir, self.target, self.compress_report)
+        return self._reporter
+
     def run(self):
-        """Main scanning method"""
+        """Main scanning method
+
+        Returns True when the scan ran to completion, False when it was
+        interrupted or failed.
+        """
         banner()
         print_info(f"Starting scan against {self.target}")
         self.logger.log(f"Scan started against {self.target}")
 
+        completed = False
         try:
             wp_info = self._run_fingerprinting()
             if not wp_info.get("is_wordpress"):
-                return
+                self.close()
+                return True
 
             vulnerabilities = self._run_vulnerability_scan(wp_info)
+            self.last_vulnerabilities = vulnerabilities
             if vulnerabilities and self.exploit:
                 self._run_exploitation(vulnerabilities)
 
             self._generate_report(wp_info, vulnerabilities, {})
+            completed = True
 
         except KeyboardInterrupt:
             print_warning("Scan interrupted by user")
@@ -122,20 +228,28 @@ class WPScanner:
         except Exception as e:
             print_error(f"An error occurred: {str(e)}")
             self.logger.log(f"Error: {str(e)}")
-        except:
-            print_error("An unexpected error occurred.")
-            self.logger.log("An unexpected error occurred.")
 
+        # Reports are flushed in the background; make sure they are on disk before finishing
+        if self._reporter is not None:
+            self._reporter.wait_for_writes()
+        self.close()
         print_info(f"Scan completed. Results saved to {self.output_dir}")
         self.logger.log(f"Scan completed. Results saved to {self.output_dir}")
+        return completed
+
+    def close(self):
+        """Release the scanner's worker pool unless it was handed in."""
+        if self._vuln_scanner is not None:
+            self._vuln_scanner.close()
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
 
     def _run_fingerprinting(self):
         """Run the fingerprinting process."""
         wp_info = self.fingerprinter.fingerprint()
         if wp_info.get("is_wordpress"):
             print_success("WordPress information gathered successfully")
-            with open(os.path.join(self.output_dir, 'wp_info.json'), 'w') as f:
-                json.dump(wp_info, f, indent=4)
+            _write_json(os.path.join(self.output_dir, 'wp_info.json'), wp_info)
         else:
             self.logger.log(f"Target {self.target} is not running WordPress")
         return wp_info
@@ -145,8 +259,7 @@ class WPScanner:
         print_info("Scanning for vulnerabilities...")
         vulnerabilities = self.vuln_scanner.scan(wp_info)
         if vulnerabilities:
-            with open(os.path.join(self.output_dir, 'vulnerabilities.json'), 'w') as f:
-                json.dump(vulnerabilities, f, indent=4)
+            _write_json(os.path.join(self.output_dir, 'vulnerabilities.json'), vulnerabilities)
         return vulnerabilities
 
     def _run_exploitation(self, vulnerabilities):
@@ -174,8 +287,7 @@ class WPScanner:
 
         print_info("Attempting to exploit vulnerabilities...")
         exploitation_results = self.exploiter.exploit(vuln_list)
-        with open(os.path.join(self.output_dir, 'exploitation_results.json'), 'w') as f:
-            json.dump(exploitation_results, f, indent=4)
+        _write_json(os.path.join(self.output_dir, 'exploitation_results.json'), exploitation_results)
         return exploitation_results
 
     def _generate_report(self, wp_info, vulnerabilities, exploitation_results):
@@ -187,55 +299,65 @@ class WPScanner:
             report_path = self.reporter.generate_markdown_report(wp_info, vulnerabilities, exploitation_results)
             print_success(f"Markdown report generated: {report_path}")
         else: # Default to console output and JSON
-            print("\n" + "="*80)
-            print(f"{Fore.CYAN}SCAN SUMMARY FOR {self.target}{Style.RESET_ALL}")
-            print("="*80)
+            # Collected and written in one go, so the summary of one target is
+            # never interleaved with output from another during a mass scan
+            lines = ["\n" + _SEP, f"{Fore.CYAN}SCAN SUMMARY FOR {self.target}{Style.RESET_ALL}", _SEP]
 
             if wp_info:
-                print(f"\n{Fore.BLUE}WordPress Information:{Style.RESET_ALL}")
-                print(f"  • Version: {Fore.YELLOW}{wp_info.get('version', 'Unknown')}{Style.RESET_ALL}")
-                if wp_info.get('version_sources'):
-                    print(f"  • Version Sources: {', '.join(wp_info.get('version_sources', []))}")
+                version_sources = wp_info.get('version_sources')
+                themes = wp_info.get('themes')
+                plugins = wp_info.get('plugins')
+                users = wp_info.get('users') or ()
+                xmlrpc_enabled = wp_info.get('xmlrpc_enabled', False)
+                rest_api_enabled = wp_info.get('rest_api_enabled', False)
+
+                lines.append(_WP_INFO_HEADER)
+                lines.append(f"  • Version: {Fore.YELLOW}{wp_info.get('version', 'Unknown')}{Style.RESET_ALL}")
+                if version_sources:
+                    lines.append(f"  • Version Sources: {', '.join(version_sources)}")
                 
-                if wp_info.get('themes'):
-                    themes_str = ", ".join([f"{t.get('name', 'Unknown')} (v{t.get('version', 'Unknown')})" for t in wp_info.get('themes', [])])
-                    print(f"  • Themes: {Fore.MAGENTA}{themes_str}{Style.RESET_ALL}")
+                if themes:
+                    themes_str = ", ".join([f"{t.get('name', 'Unknown')} (v{t.get('version', 'Unknown')})" for t in themes])
+                    lines.append(f"  • Themes: {Fore.MAGENTA}{themes_str}{Style.RESET_ALL}")
 
-                if wp_info.get('plugins'):
-                    plugins_str = ", ".join([f"{p.get('name', 'Unknown')} (v{p.get('version', 'Unknown')})" for p in wp_info.get('plugins', {}).values()])
-                    print(f"  • Plugins: {Fore.CYAN}{plugins_str}{Style.RESET_ALL}")
+                if plugins:
+                    plugins_str = ", ".join([f"{p.get('name', 'Unknown')} (v{p.get('version', 'Unknown')})" for p in plugins.values()])
+                    lines.append(f"  • Plugins: {Fore.CYAN}{plugins_str}{Style.RESET_ALL}")
 
-                user_count = len(wp_info.get('users', []))
-                if user_count > 0:
-                    user_info = [f"{user.get('name', user.get('slug', 'Unknown'))} (ID: {user.get('id')})" for user in wp_info.get('users', [])[:5]]
-                    print(f"  • Users: {user_count} found - {', '.join(user_info)}")
+                if users:
+                    user_info = [f"{user.get('name', user.get('slug', 'Unknown'))} (ID: {user.get('id')})" for user in users[:5]]
+                    lines.append(f"  • Users: {len(users)} found - {', '.join(user_info)}")
 
-                print(f"  • XML-RPC Enabled: {Fore.GREEN if wp_info.get('xmlrpc_enabled') else Fore.RED}{wp_info.get('xmlrpc_enabled', False)}{Style.RESET_ALL}")
-                print(f"  • REST API Enabled: {Fore.GREEN if wp_info.get('rest_api_enabled') else Fore.RED}{wp_info.get('rest_api_enabled', False)}{Style.RESET_ALL}")
+                lines.append(f"  • XML-RPC Enabled: {Fore.GREEN if xmlrpc_enabled else Fore.RED}{xmlrpc_enabled}{Style.RESET_ALL}")
+                lines.append(f"  • REST API Enabled: {Fore.GREEN if rest_api_enabled else Fore.RED}{rest_api_enabled}{Style.RESET_ALL}")
 
             if vulnerabilities:
-                print(f"\n{Fore.RED}Vulnerabilities Found:{Style.RESET_ALL}")
+                lines.append(_VULNS_HEADER)
                 # Core vulnerabilities
                 if vulnerabilities.get("core"):
-                    print(f"  {Fore.YELLOW}Core:{Style.RESET_ALL}")
+                    lines.append(_CORE_HEADER)
                     for vuln in vulnerabilities["core"]:
-                        print(f"    - {vuln.get('title')} ({vuln.get('severity')})")
+                        lines.append(f"    - {vuln.get('title')} ({vuln.get('severity')})")
                 # Plugin vulnerabilities
                 if vulnerabilities.get("plugins"):
-                    print(f"  {Fore.YELLOW}Plugins:{Style.RESET_ALL}")
+                    lines.append(_PLUGINS_HEADER)
                     for plugin, data in vulnerabilities["plugins"].items():
                         if "vulns" in data:
                             for vuln in data["vulns"]:
-                                print(f"    - {plugin}: {vuln.get('title')} ({vuln.get('severity')})")
+                                lines.append(f"    - {plugin}: {vuln.get('title')} ({vuln.get('severity')})")
                 # Theme vulnerabilities
                 if vulnerabilities.get("themes"):
-                    print(f"  {Fore.YELLOW}Themes:{Style.RESET_ALL}")
+                    lines.append(_THEMES_HEADER)
                     for theme, data in vulnerabilities["themes"].items():
                         if "vulns" in data:
                             for vuln in data["vulns"]:
-                                print(f"    - {theme}: {vuln.get('title')} ({vuln.get('severity')})")
+                                lines.append(f"    - {theme}: {vuln.get('title')} ({vuln.get('severity')})")
             
-            print("\n" + "="*80)
+            lines.append("\n" + _SEP)
+            lines.append("")
+            with self._stdout_lock:
+                sys.stdout.write("\n".join(lines))
+                sys.stdout.flush()
 class MassScanner:
     def __init__(self, args):
         self.args = args
@@ -243,35 +365,52 @@ class MassScanner:
         self.mass_output_dir = args.mass_output_dir or "mass_scan_results"
         self.threads = args.threads
         self.targets = []
+        # Vulnerability-check pool shared by every target's WPScanner, live during run()
+        self.checks_executor = None
+        # One pool per concurrently scanned host, shared by every WPScanner
+        self.session = create_session(self.threads, args.proxy, pool_connections=self.threads)
 
     def run(self):
         """Run the mass scanning process."""
         try:
-            if not os.path.isfile(self.targets_file):
+            try:
+                with open(self.targets_file, 'r') as f:
+                    self.targets = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            except FileNotFoundError:
                 print_error(f"File not found: {self.targets_file}")
                 sys.exit(1)
 
-            if not os.path.exists(self.mass_output_dir):
-                os.makedirs(self.mass_output_dir)
-
-            with open(self.targets_file, 'r') as f:
-                self.targets = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            os.makedirs(self.mass_output_dir, exist_ok=True)
             print_info(f"Loaded {len(self.targets)} targets from {self.targets_file}")
 
-            summary_file = os.path.join(self.mass_output_dir, f"mass_scan_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-            summary_lock = Lock()
-
-            with open(summary_file, 'w') as f:
-                f.write(f"WP-Scanner Mass Scan Summary\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Targets: {len(self.targets)}\n")
-                f.write(f"Threads: {self.threads}\n\n")
-                f.write("=" * 80 + "\n\n")
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
-                scan_results = list(executor.map(self.scan_target, enumerate(self.targets), [summary_file]*len(self.targets), [summary_lock]*len(self.targets)))
-
-            successful = sum(1 for _, success, _ in scan_results if success)
+            started = datetime.now()
+            summary_file = os.path.join(self.mass_output_dir, f"mass_scan_summary_{started.strftime('%Y%m%d_%H%M%S')}.txt")
+
+            successful = 0
+            # One handle for the whole scan: the header, then one block per finished target
+            with open(summary_file, 'w') as summary, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="wp-checks") as checks_executor, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as executor:
+                self.checks_executor = checks_executor
+                summary.write(_SUMMARY_HEADER.format(date=started.strftime('%Y-%m-%d %H:%M:%S'),
+                                                     total=len(self.targets), threads=self.threads))
+                summary.flush()
+                futures = {executor.submit(self.scan_target, target_info): target_info[1]
+                           for target_info in enumerate(self.targets)}
+                # Count targets as they finish so a slow one never holds up the rest.
+                # Only this thread writes the summary, so workers never wait on a lock.
+                for future in concurrent.futures.as_completed(futures):
+                    target = futures.pop(future)
+                    try:
+                        _, success, entry = future.result()
+                    except Exception as e:
+                        print_error(f"Scan of {target} failed: {str(e)}")
+                        success, entry = False, None
+                    if entry:
+                        summary.write(entry)
+                        summary.flush()
+                    if success:
+                        successful += 1
             failed = len(self.targets) - successful
 
             print_success(f"\nMass scan completed!")
@@ -283,46 +422,46 @@ class MassScanner:
             print_error(f"An error occurred during mass scan: {str(e)}")
             sys.exit(1)
 
-    def scan_target(self, target_info, summary_file, summary_lock):
-        """Scan a single target."""
+    def scan_target(self, target_info):
+        """Scan a single target.
+
+        Returns (target, success, summary_entry), where summary_entry is the
+        text block for the mass-scan summary file.
+        """
         idx, target = target_info
         print_info(f"[{idx+1}/{len(self.targets)}] Scanning target: {target}")
         
-        args = self.args
+        # Workers run concurrently, so each scan gets its own copy of the options
+        args = argparse.Namespace(**vars(self.args))
         args.target = target
         
-        if args.output:
-            target_output_dir = os.path.join(args.output, urlparse(target).netloc)
-        else:
-            target_output_dir = os.path.join(self.mass_output_dir, urlparse(target).netloc)
+        netloc = urlparse(target).netloc
+        target_output_dir = os.path.join(args.output or self.mass_output_dir, netloc)
+        # WPScanner creates the output directory itself
         args.output = target_output_dir
-        create_directory(target_output_dir)
         
-        scanner = WPScanner(args)
-        scanner.run()
+        try:
+            scanner = WPScanner(args, session=self.session, executor=self.checks_executor)
+            success = scanner.run()
+        except Exception as e:
+            print_error(f"Scan of {target} failed: {str(e)}")
+            return (target, False, f"Target: {target}\nStatus: Failed\nError: {str(e)}\n" + _SUMMARY_RULE)
         
-        # Update summary (thread-safe)
-        with summary_lock:
-            with open(summary_file, 'a') as f:
-                f.write(f"Target: {target}\n")
-                f.write(f"Status: Completed\n")
-                f.write(f"Output Directory: {scanner.output_dir}\n")
-                
-                vuln_file = os.path.join(scanner.output_dir, 'vulnerabilities.json')
-                if os.path.exists(vuln_file):
-                    try:
-                        with open(vuln_file, 'r') as vf:
-                            vulns = json.load(vf)
-                            vuln_count = len(vulns.get("core", [])) + len(vulns.get("plugins", {})) + len(vulns.get("themes", {}))
-                            f.write(f"Vulnerabilities Found: {vuln_count}\n")
-                    except Exception as e:
-                        f.write(f"Error reading vulnerabilities: {str(e)}\n")
-                else:
-                    f.write("Vulnerabilities Found: 0\n")
-                
-                f.write("\n" + "-" * 80 + "\n\n")
+        lines = [
+            f"Target: {target}\n",
+            f"Status: {'Completed' if success else 'Failed'}\n",
+            f"Output Directory: {scanner.output_dir}\n",
+        ]
+        # Counted from the scanner's in-memory result instead of re-reading vulnerabilities.json
+        vulns = scanner.last_vulnerabilities
+        if vulns:
+            vuln_count = len(vulns.get("core", [])) + len(vulns.get("plugins", {})) + len(vulns.get("themes", {}))
+            lines.append(f"Vulnerabilities Found: {vuln_count}\n")
+        else:
+            lines.append("Vulnerabilities Found: 0\n")
+        lines.append(_SUMMARY_RULE)
         
-        return (target, True, None)
+        return (target, success, "".join(lines))
 
 def main():
     try:
@@ -340,6 +479,7 @@ def main():
         parser.add_argument('--update', action='store_true', help='Update the tool and vulnerability databases')
         parser.add_argument('--auto-update', action='store_true', help='Automatically update the tool before scanning')
         parser.add_argument('--report-format', default='console', choices=['console', 'html', 'md'], help='Output report format (default: console)')
+        parser.add_argument('--compress-report', action='store_true', help='Write HTML/Markdown reports gzip-compressed (.gz)')
         
         args = parser.parse_args()
         